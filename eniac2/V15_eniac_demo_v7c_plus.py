@@ -26,6 +26,7 @@ Notes
 """
 
 import sys, time, math, json, os
+import concurrent.futures
 from dataclasses import dataclass, asdict
 from typing import List, Tuple, Optional, Dict
 
@@ -292,13 +293,23 @@ class Plugboard:
                 name=self.nearest_port_at(*e.pos)
                 if name and name!=self.drag_from: self.add_cable(self.drag_from, name)
                 self.drag_from=None
+    def snapshot(self):
+        return {"cables":[asdict(c) for c in self.cables]}
+    def restore(self, data):
+        self.cables=[Cable(**c) for c in data.get("cables",[])]
     def save(self, path):
-        data={"cables":[asdict(c) for c in self.cables]}
-        with open(path,"w",encoding="utf-8") as f: json.dump(data,f,ensure_ascii=False,indent=2)
+        _write_wiring_json(path, self.snapshot())
     def load(self, path):
-        if not os.path.exists(path): return
-        with open(path,"r",encoding="utf-8") as f: data=json.load(f)
-        self.cables=[Cable(**c) for c in data.get("cables",[])]
+        data=_read_wiring_json(path)
+        if data is not None: self.restore(data)
+
+# plain functions so wiring I/O can run on a worker thread (no pygame state touched)
+def _write_wiring_json(path, data):
+    with open(path,"w",encoding="utf-8") as f: json.dump(data,f,ensure_ascii=False,indent=2)
+
+def _read_wiring_json(path):
+    if not os.path.exists(path): return None
+    with open(path,"r",encoding="utf-8") as f: return json.load(f)
 
 class TimingChart:
     """Digital rectangular pulses; 300 columns (10 ring × 30 micro) + history buffer to draw full calc."""
@@ -426,6 +437,9 @@ class Demo:
         # state history
         self.history=[]; self.hist_idx=0; self.history_cap=self.timing.history_len
         self.shift_anim=0  # visual 10-pulse animation, not used here
+        # wiring save/load runs on a worker so disk I/O never stalls the render loop
+        self._io_pool=concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._save_future=None; self._load_future=None; self._io_status=""
         self._build_ports(); self._default_wiring(); self.reset()
     def _build_ports(self):
         # Top CT ports
@@ -587,6 +601,17 @@ class Demo:
                 if c.a=="RP": paths.append((c.a,c.b,"ctrl"))
         return paths
     def update(self,dt):
+        # splice in completed wiring I/O (state mutation stays on the main thread)
+        if self._save_future is not None and self._save_future.done():
+            # surface write errors instead of silently reporting success
+            err=self._save_future.exception(); self._save_future=None
+            self._io_status="wiring saved" if err is None else f"save failed: {err}"
+        if self._load_future is not None and self._load_future.done():
+            data=self._load_future.result(); self._load_future=None
+            if data is not None:
+                self.pb.restore(data); self._io_status="wiring loaded"
+            else:
+                self._io_status="no wiring file"
         # pause after ring
         if self.timing.wait_timer>0:
             self.timing.wait_timer-=dt; return
@@ -613,14 +638,21 @@ class Demo:
         # Info
         st_names=['LOAD','MULT','ADD','SUB','DIV','SQRT','PUNCH','DONE']
         info=f"[Stage {st_names[self.stage]}] SPACE run/pause | ENTER step | R reset | </> rewind/forward | CTRL+</> x10 | -/+ speed | A auto-wire | S/L save/load | Cables:{len(self.pb.cables)}"
+        if self._io_status: info+=f" | {self._io_status}"
         screen.blit(FONT.render(info,True,TEXT),(20,100))
         # Timing
         self.timing.draw(self.hist_idx%self.timing.history_len)
         # wires last + pulse position within micro-step
         _,micro=self.ring_state(); tpos=micro/30.0
         self.pb.draw_cables(self.active_paths(), tpos)
-    def save_wiring(self): self.pb.save("./plugboard_v7cplus.json")
-    def load_wiring(self): self.pb.load("./plugboard_v7cplus.json")
+    def save_wiring(self):
+        # snapshot synchronously (cheap), write on the worker
+        snapshot=self.pb.snapshot()
+        self._io_status="saving..."
+        self._save_future=self._io_pool.submit(_write_wiring_json,"./plugboard_v7cplus.json",snapshot)
+    def load_wiring(self):
+        self._io_status="loading..."
+        self._load_future=self._io_pool.submit(_read_wiring_json,"./plugboard_v7cplus.json")
 
 def main():
     demo=Demo(); last=time.time()
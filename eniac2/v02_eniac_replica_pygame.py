@@ -27,6 +27,9 @@ FONT = pygame.font.SysFont("dejavusansmono,consolas,menlo,monospace", 16)
 FONT_SM = pygame.font.SysFont("dejavusansmono,consolas,menlo,monospace", 13, bold=False)
 FONT_BIG = pygame.font.SysFont("dejavusansmono,consolas,menlo,monospace", 22, bold=True)
 
+# pre-rendered lamp digit glyphs (0..9) so draw loops blit instead of re-rendering
+DIGIT_YELLOW = [FONT_SM.render(str(d), True, YELLOW) for d in range(10)]
+
 # ------------------ UI helpers ------------------
 def draw_panel(rect, title=None):
     pygame.draw.rect(screen, PANEL, rect, border_radius=6)
@@ -88,6 +91,8 @@ class Jack:
 class Cable:
     a:int; b:int; color:Tuple[int,int,int]=ACCENT
     # a,b index into Plugboard.jacks
+    # endpoint pixel coords, resolved once at insertion (jacks never move)
+    ax:int=0; ay:int=0; bx:int=0; by:int=0
 
 class Plugboard:
     def __init__(self, rect:pygame.Rect, rows=6, cols=22, label=""):
@@ -105,6 +110,7 @@ class Plugboard:
                 self.jacks.append(Jack(x,y,id=f"J{r}-{c}"))
         self.pending: Optional[int] = None
         self.label = label
+        self._last_anim_rect: Optional[pygame.Rect] = None
     def draw(self):
         # grid lines
         for r in range(self.rows):
@@ -117,10 +123,9 @@ class Plugboard:
         for j in self.jacks: j.draw()
         # cables
         for cab in self.cables:
-            a = self.jacks[cab.a]; b = self.jacks[cab.b]
-            pygame.draw.line(screen, cab.color, (a.x,a.y), (b.x,b.y), 4)
-            pygame.draw.circle(screen, cab.color, (a.x,a.y), 5, 2)
-            pygame.draw.circle(screen, cab.color, (b.x,b.y), 5, 2)
+            pygame.draw.line(screen, cab.color, (cab.ax,cab.ay), (cab.bx,cab.by), 4)
+            pygame.draw.circle(screen, cab.color, (cab.ax,cab.ay), 5, 2)
+            pygame.draw.circle(screen, cab.color, (cab.bx,cab.by), 5, 2)
         if self.label:
             t = FONT_BIG.render(self.label, True, YELLOW)
             screen.blit(t, (self.rect.centerx - t.get_width()//2, self.rect.y - 28))
@@ -132,17 +137,23 @@ class Plugboard:
                         self.pending = idx
                     else:
                         if self.pending != idx:
-                            self.cables.append(Cable(self.pending, idx))
+                            a = self.jacks[self.pending]; b = self.jacks[idx]
+                            self.cables.append(Cable(self.pending, idx,
+                                                     ax=a.x, ay=a.y, bx=b.x, by=b.y))
                         self.pending = None
                     return True
         return False
     def animate_along(self, cable_index:int, t:float):
         if cable_index<0 or cable_index>=len(self.cables): return
         cab = self.cables[cable_index]
-        a=self.jacks[cab.a]; b=self.jacks[cab.b]
-        x = int(a.x + (b.x-a.x)*t); y = int(a.y + (b.y-a.y)*t)
+        x = int(cab.ax + (cab.bx-cab.ax)*t); y = int(cab.ay + (cab.by-cab.ay)*t)
         pygame.draw.circle(screen, (255,255,255), (x,y), 6)
         pygame.draw.circle(screen, (80,180,255), (x,y), 9, 2)
+        r = pygame.Rect(x-12, y-12, 24, 24)
+        if self._last_anim_rect is not None:
+            DIRTY.append(self._last_anim_rect)
+        DIRTY.append(r)
+        self._last_anim_rect = r
 
 # ------------------ Cycling waveforms ------------------
 WAVES = ["CPP","10P","9P","8P","7P","6P","5P","4P","3P","2P","1P","CCG","RP"]
@@ -151,7 +162,8 @@ class WavePanel:
         self.rect = pygame.Rect(rect)
         self.cursor = 0           # 0..9 step inside add-time, plus CCG/RP illustratively
         self.period = 10
-        self.mode = "ONE-ADD"     # ONE-ADD or ONE-PULSE or RUN
+        self._last_cursor_rect: Optional[pygame.Rect] = None
+        self.set_mode("ONE-ADD")  # ONE-ADD or ONE-PULSE or RUN
     def draw(self):
         pygame.draw.rect(screen, PANEL_DARK, self.rect, border_radius=6)
         pygame.draw.rect(screen, (40,40,40), self.rect, 1, border_radius=6)
@@ -167,13 +179,27 @@ class WavePanel:
         # cursor
         x = int(self.rect.x + 80 + (self.rect.width-100) * (self.cursor / max(1,self.period)))
         pygame.draw.line(screen, (250,120,120), (x, self.rect.y+6), (x, self.rect.bottom-6), 2)
-    def step_pulse(self):
-        if self.mode == "ONE-PULSE":
-            self.cursor = (self.cursor+1) % self.period
-        elif self.mode == "ONE-ADD":
-            self.cursor = (self.cursor + self.period) % self.period
+        cur = pygame.Rect(x-1, self.rect.y+6, 3, self.rect.height-12)
+        if self._last_cursor_rect is not None and self._last_cursor_rect != cur:
+            DIRTY.append(self._last_cursor_rect)
+        DIRTY.append(cur)
+        self._last_cursor_rect = cur
+    # step_pulse is rebound per mode in set_mode() so stepping never
+    # re-compares the mode string; self.mode stays for the status display
+    def _step_onepulse(self):
+        self.cursor = (self.cursor+1) % self.period
+    def _step_oneadd(self):
+        self.cursor = (self.cursor + self.period) % self.period
+    def _step_run(self):
+        self.cursor = (self.cursor+1) % self.period
+    def set_mode(self, mode:str):
+        self.mode = mode
+        if mode == "ONE-PULSE":
+            self.step_pulse = self._step_onepulse
+        elif mode == "ONE-ADD":
+            self.step_pulse = self._step_oneadd
         else:
-            self.cursor = (self.cursor+1) % self.period
+            self.step_pulse = self._step_run
 
 # ------------------ Units ------------------
 class InitiatingUnit:
@@ -215,34 +241,41 @@ class AccPanel:
         # program switch rows (illustrative)
         self.switch_rects = [pygame.Rect(self.rect.x+14 + (i*22), self.rect.y+130 + (r*20), 16, 12)
                              for r in range(6) for i in range(10)]
+        # top lamp label positions, flattened once (avoids 100 coordinate computations per frame)
+        lamp_area = pygame.Rect(self.rect.x+0, self.rect.y+0, self.rect.width, 80)
+        self._lamp_positions = [(lamp_area.x+70 + j*40 + (i//5)*520,
+                                 lamp_area.y+10 + (i%5)*14, 9-j)
+                                for i in range(10) for j in range(10)]
+        # sub-panel geometry hoisted out of draw() so the hot path allocates nothing
+        self._left_rect  = pygame.Rect(self.rect.x+16, self.rect.y+120, 480, 180)
+        self._right_rect = pygame.Rect(self.rect.x+520, self.rect.y+120, 480, 180)
+        self._sub_rects = (self._left_rect, self._right_rect)
+        self._plus_rects = [(rr.x+8, rr.y+8, 22, 18) for rr in self._sub_rects]
+        self._plus_surf = FONT_SM.render("+", True, (10,60,10))
+        self._legend = [(FONT_SM.render(str(i), True, (10,10,10)), rr.x+54 + i*40, rr.y+8)
+                        for rr in self._sub_rects for i in range(10)]
+        self._switch_positions = [(rr.x + 50 + i*40, rr.y + 34 + r*22)
+                                  for rr in self._sub_rects for r in range(6) for i in range(10)]
     def draw(self):
         draw_panel(self.rect, "Accumulators")
         # two sub-panels like screenshot (left/right)
-        left = pygame.Rect(self.rect.x+16, self.rect.y+120, 480, 180)
-        right= pygame.Rect(self.rect.x+520, self.rect.y+120, 480, 180)
-        for rr in (left,right):
+        for rr in self._sub_rects:
             pygame.draw.rect(screen, (230,230,230), rr, border_radius=4)
             pygame.draw.rect(screen, (30,30,30), rr, 1, border_radius=4)
-            # little plus switch
-            pygame.draw.rect(screen, (180,255,180), (rr.x+8, rr.y+8, 22, 18), border_radius=4)
-            t = FONT_SM.render("+", True, (10,60,10)); screen.blit(t,(rr.x+14, rr.y+8))
-            # numeric legends
-            for i in range(10):
-                n = FONT_SM.render(str(i), True, (10,10,10))
-                screen.blit(n, (rr.x+54 + i*40, rr.y+8))
-            # fake rotary/switch rows
-            for r in range(6):
-                y = rr.y + 34 + r*22
-                for i in range(10):
-                    x = rr.x + 50 + i*40
-                    pygame.draw.rect(screen, (250,250,250), (x,y,26,12))
-                    pygame.draw.rect(screen, (10,10,10), (x,y,26,12), 1)
+        # little plus switches
+        for pr in self._plus_rects:
+            pygame.draw.rect(screen, (180,255,180), pr, border_radius=4)
+            screen.blit(self._plus_surf, (pr[0]+6, pr[1]))
+        # numeric legends
+        for surf, x, y in self._legend:
+            screen.blit(surf, (x, y))
+        # fake rotary/switch rows
+        for x, y in self._switch_positions:
+            pygame.draw.rect(screen, (250,250,250), (x,y,26,12))
+            pygame.draw.rect(screen, (10,10,10), (x,y,26,12), 1)
         # top lamps (0..9 rows) stylized
-        lamp_area = pygame.Rect(self.rect.x+0, self.rect.y+0, self.rect.width, 80)
-        for i in range(10):
-            for j in range(10):
-                tx = FONT_SM.render(str(9-j), True, YELLOW)
-                screen.blit(tx, (lamp_area.x+70 + j*40 + (i//5)*520, lamp_area.y+10 + (i%5)*14))
+        for x, y, d in self._lamp_positions:
+            screen.blit(DIGIT_YELLOW[d], (x, y))
         # plugboards left/right
         self.pb_left.draw(); self.pb_right.draw()
 
@@ -261,10 +294,16 @@ pb2 = Plugboard(pygame.Rect(360, 600, 420, 120), rows=4, cols=20, label="")
 pb3 = Plugboard(pygame.Rect(820, 600, 440, 120), rows=4, cols=22, label="")
 acc_pan.attach_boards(pb2, pb3)
 
-# cable animation bookkeeping
+# cable animation bookkeeping (integer step counter: no float drift,
+# and ready for batching multiple simultaneous animations later)
 anim_index = None
-anim_t = 0.0
-anim_speed = 0.02
+anim_step = 0
+ANIM_STEPS = 50
+
+# dirty rectangles collected during draw(); main() uploads only these
+# regions via pygame.display.update() instead of flipping the full window
+DIRTY: List[pygame.Rect] = []
+FULL_REDRAW = True  # first frame (and any frame after an input event) uploads everything
 
 # mode buttons (one-pulse / one-add)
 btn_one_pulse = Button((940, 150, 120, 28), "one-pulse")
@@ -283,32 +322,37 @@ def draw():
     # plugboards bottom
     pb1.draw(); pb2.draw(); pb3.draw()
     # animate along first cable of pb2 if any and if in step
-    global anim_index, anim_t
+    global anim_index, anim_step
     if anim_index is not None and pb2.cables:
-        pb2.animate_along(anim_index, anim_t)
-        anim_t += anim_speed
-        if anim_t >= 1.0:
+        pb2.animate_along(anim_index, anim_step / ANIM_STEPS)
+        anim_step += 1
+        if anim_step > ANIM_STEPS:
             anim_index = None
-            anim_t = 0.0
+            anim_step = 0
+            # 마지막 프레임의 점이 지워진 영역도 업로드해야 잔상이 안 남음
+            if pb2._last_anim_rect is not None:
+                DIRTY.append(pb2._last_anim_rect)
+                pb2._last_anim_rect = None
     # mode buttons
     btn_one_pulse.draw(); btn_one_add.draw()
     m = FONT.render(f"mode: {wave.mode}  cursor:{wave.cursor}", True, TEXT)
     screen.blit(m, (360, 192))
 
 def handle(e):
-    global anim_index, anim_t
+    global anim_index, anim_step
     init_unit.handle(e)
-    if btn_one_pulse.handle(e): wave.mode = "ONE-PULSE"
-    if btn_one_add.handle(e): wave.mode = "ONE-ADD"
+    if btn_one_pulse.handle(e): wave.set_mode("ONE-PULSE")
+    if btn_one_add.handle(e): wave.set_mode("ONE-ADD")
     pb1.handle(e); pb2.handle(e); pb3.handle(e)
     # start an animation when STEP pressed: if pb2 has a cable, animate the last one
     if e.type == pygame.MOUSEBUTTONDOWN and e.button==1:
         # detect if last action was STEP (status set by InitiatingUnit)
         if init_unit.status == "STEP" and pb2.cables:
             anim_index = len(pb2.cables)-1
-            anim_t = 0.0
+            anim_step = 0
 
 def main():
+    global FULL_REDRAW
     while True:
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
@@ -316,8 +360,14 @@ def main():
             if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
                 pygame.quit(); sys.exit(0)
             handle(e)
+            FULL_REDRAW = True  # events may change arbitrary regions
         draw()
-        pygame.display.flip()
+        if FULL_REDRAW:
+            pygame.display.flip()
+            FULL_REDRAW = False
+        else:
+            pygame.display.update(DIRTY)
+        DIRTY.clear()
         clock.tick(60)
 
 if __name__ == "__main__":
@@ -28,18 +28,56 @@ Notes:
     - For brevity it's a single-file build; logic is modularized into classes inside.
 """
 
-import sys, math, time
+import sys, math, time, functools
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+import numpy as np
 import pygame
 
+def _add_col(digits, value, index):
+    """BCD carry kernel: add value at digit index (MSB..LSB) with ripple carry."""
+    i = index
+    c = value
+    while i >= 0 and c > 0:
+        s = digits[i] + c
+        digits[i] = s % 10
+        c = s // 10
+        i -= 1
+
+try:  # JIT the integer carry loop when numba is available; plain Python otherwise
+    from numba import njit
+    _add_col = njit("void(uint8[:], int64, int64)", cache=True)(_add_col)
+except ImportError:
+    pass
+
 pygame.init()
 pygame.display.set_caption("ENIAC (Pygame) — Virtual Replica")
 
+# The sim only consumes mouse, keyboard and QUIT events; block the rest at the
+# SDL level so the queue never fills with event objects we would just skip over.
+# Not every name exists on both pygame and pygame-ce (e.g. WINDOWEVENT), so
+# resolve them defensively instead of crashing at import on one runtime.
+pygame.event.set_blocked([
+    getattr(pygame, name) for name in (
+        "TEXTINPUT", "WINDOWEVENT", "ACTIVEEVENT",
+        "JOYAXISMOTION", "JOYBUTTONDOWN", "JOYBUTTONUP",
+        "JOYHATMOTION",
+    ) if hasattr(pygame, name)
+])
+
 # -------------------- Theme / Geometry --------------------
 W, H = 1320, 820
-screen = pygame.display.set_mode((W, H))
+# Prefer a double-buffered, vsynced display so flips are GPU-presented and
+# aligned to the refresh; fall back to the plain software window if refused.
+try:
+    screen = pygame.display.set_mode((W, H), pygame.DOUBLEBUF | pygame.SCALED, vsync=1)
+except pygame.error:
+    screen = pygame.display.set_mode((W, H))
+try:
+    VSYNC = bool(pygame.display.is_vsync())
+except Exception:
+    VSYNC = False
 clock = pygame.time.Clock()
 
 BG = (62, 64, 68)
@@ -53,19 +91,68 @@ CTRL = (255, 206, 120)        # Control
 OK = (100, 230, 120)
 ERR = (255, 120, 120)
 
+# Frequently used small constants bound once at module level so draw paths
+# reference pre-allocated objects instead of rebuilding tuple literals
+BORDER_COL   = (40,40,40)
+CABLE_COL    = (180,180,180)
+RAIL_COL     = (120,120,120)
+JACK_COL     = (15,15,15)
+JACK_RING    = (180,180,180)
+TIP_INK      = (20,20,20)
+TIP_BG       = (240,240,240)
+CURSOR_COL   = (255,120,120)
+SLIDER_COL   = (180,180,180)
+KNOB_COL     = (230,230,230)
+TOOLBAR_COL  = (192,192,192)
+PENDING_COL  = (180,180,220)
+LAMP_EDGE    = (35,35,35)
+LAMP_ON_COL  = (250,240,120)
+LAMP_OFF_COL = (90,90,90)
+RING_ON_COL  = (90,220,120)
+RING_OFF_COL = (80,80,80)
+RING_START   = -math.pi/2
+
 FONT = pygame.font.SysFont("dejavusansmono,consolas,menlo,monospace", 16)
 FONT_SM = pygame.font.SysFont("dejavusansmono,consolas,menlo,monospace", 13)
 FONT_BIG = pygame.font.SysFont("dejavusansmono,consolas,menlo,monospace", 22, bold=True)
 
-def draw_panel(rect, title=None):
-    pygame.draw.rect(screen, PANEL, rect, border_radius=8)
-    pygame.draw.rect(screen, (40,40,40), rect, 1, border_radius=8)
+@functools.lru_cache(maxsize=512)
+def render_cached(font, text, color):
+    """Memoized font.render — repeated frames blit a cached Surface instead of
+    re-rasterizing the same text through SDL_ttf (color must be a tuple)."""
+    return font.render(text, True, color).convert_alpha()
+
+def draw_panel(rect, title=None, surface=None):
+    surface = screen if surface is None else surface
+    pygame.draw.rect(surface, PANEL, rect, border_radius=8)
+    pygame.draw.rect(surface, BORDER_COL, rect, 1, border_radius=8)
     if title:
-        t = FONT_BIG.render(title, True, TEXT)
-        screen.blit(t, (rect.x + 12, rect.y + 10))
+        t = render_cached(FONT_BIG, title, TEXT)
+        surface.blit(t, (rect.x + 12, rect.y + 10))
+
+# Tiny lamp sprites: one blit replaces two draw.circle rasterizations
+def _make_lamp(color):
+    s = pygame.Surface((16,16), pygame.SRCALPHA)
+    pygame.draw.circle(s, color, (8,8), 7)
+    pygame.draw.circle(s, LAMP_EDGE, (8,8), 7, 1)
+    return s.convert_alpha()
+
+LAMP_ON  = _make_lamp(LAMP_ON_COL)
+LAMP_OFF = _make_lamp(LAMP_OFF_COL)
+RING_ON  = _make_lamp(RING_ON_COL)
+RING_OFF = _make_lamp(RING_OFF_COL)
+
+def _make_jack_cap():
+    # cable endpoint cap: dark plug with light ring, blitted over each end
+    s = pygame.Surface((16,16), pygame.SRCALPHA)
+    pygame.draw.circle(s, TIP_INK, (8,8), 7)
+    pygame.draw.circle(s, (200,200,200), (8,8), 7, 1)
+    return s.convert_alpha()
+
+JACK_CAP = _make_jack_cap()
 
 # -------------------- Ports & Cables --------------------
-@dataclass
+@dataclass(slots=True)
 class Port:
     name: str
     pos: Tuple[int,int]
@@ -74,36 +161,63 @@ class Port:
     radius: int = 8
 
 class Cable:
-    def __init__(self, a_idx:int, b_idx:int, color=(180,180,180)):
+    __slots__ = ('a_idx', 'b_idx', 'color')
+    def __init__(self, a_idx:int, b_idx:int, color=CABLE_COL):
         self.a_idx = a_idx
         self.b_idx = b_idx
         self.color = color
 
 class PlugArea:
     """Holds a set of labeled ports and user-created cables."""
+
     def __init__(self):
         self.ports: List[Port] = []
         self.cables: List[Cable] = []
         self.pending: Optional[int] = None
         self.flash_err_until = 0
+        # SoA mirror of port geometry: hit tests run as one vectorized
+        # expression over contiguous arrays, no Python loop at all
+        self._px = np.empty(0, dtype=np.int32)
+        self._py = np.empty(0, dtype=np.int32)
+        self._pr = np.empty(0, dtype=np.int32)
+        # endpoint geometry resolved on cable mutation, not per frame;
+        # segments bucketed by color so each group is one tight draw loop
+        self._segments_by_color: dict = {}
+        self._cap_blits: List[Tuple[pygame.Surface, Tuple[int,int]]] = []
 
     def add_port(self, name, pos, ptype, unit):
-        self.ports.append(Port(name, pos, ptype, unit))
+        p = Port(name, pos, ptype, unit)
+        self.ports.append(p)
+        self._px = np.append(self._px, pos[0]).astype(np.int32)
+        self._py = np.append(self._py, pos[1]).astype(np.int32)
+        self._pr = np.append(self._pr, p.radius).astype(np.int32)
+
+    def add_cable(self, a_idx, b_idx):
+        # control runs get the CTRL tint, data runs the default gray
+        color = CTRL if self.ports[a_idx].ptype == "ctrl" else CABLE_COL
+        self.cables.append(Cable(a_idx, b_idx, color))
+        a = self.ports[a_idx].pos; b = self.ports[b_idx].pos
+        self._segments_by_color.setdefault(color, []).append((a, b))
+        self._cap_blits.append((JACK_CAP, (a[0]-8, a[1]-8)))
+        self._cap_blits.append((JACK_CAP, (b[0]-8, b[1]-8)))
 
     def draw(self, hover_idx: Optional[int] = None):
-        # draw cables first
-        for cab in self.cables:
-            a = self.ports[cab.a_idx]; b = self.ports[cab.b_idx]
-            pygame.draw.line(screen, self.cable_color(), a.pos, b.pos, 5)
-            for p in (a.pos, b.pos):
-                pygame.draw.circle(screen, (20,20,20), p, 7)
-                pygame.draw.circle(screen, (200,200,200), p, 7, 1)
+        # draw cables first (endpoints resolved at add_cable time);
+        # the error-flash check happens once per frame, not per cable
+        if self.cables:
+            flashing = time.perf_counter() < self.flash_err_until
+            for color, segs in self._segments_by_color.items():
+                if flashing:
+                    color = ERR
+                for a, b in segs:
+                    pygame.draw.line(screen, color, a, b, 5)
+            screen.blits(self._cap_blits)
 
         # draw ports (above cables for visibility)
         for i,p in enumerate(self.ports):
-            col = (15,15,15)
+            col = JACK_COL
             pygame.draw.circle(screen, col, p.pos, p.radius)
-            pygame.draw.circle(screen, (180,180,180), p.pos, p.radius, 1)
+            pygame.draw.circle(screen, JACK_RING, p.pos, p.radius, 1)
 
         # tooltip
         if hover_idx is not None:
@@ -115,21 +229,16 @@ class PlugArea:
         if self.pending is not None and hover_idx is not None and self.pending != hover_idx:
             a = self.ports[self.pending].pos
             b = self.ports[hover_idx].pos
-            pygame.draw.line(screen, (180,180,220), a, b, 2)
+            pygame.draw.line(screen, PENDING_COL, a, b, 2)
 
     def tooltip(self, pos, text):
-        surf = FONT.render(text, True, (20,20,20))
+        surf = render_cached(FONT, text, TIP_INK)
         rect = surf.get_rect()
         rect.topleft = (pos[0]+12, pos[1]-rect.height-4)
-        pygame.draw.rect(screen, (240,240,240), rect.inflate(10,6), border_radius=6)
-        pygame.draw.rect(screen, (40,40,40), rect.inflate(10,6), 1, border_radius=6)
+        pygame.draw.rect(screen, TIP_BG, rect.inflate(10,6), border_radius=6)
+        pygame.draw.rect(screen, BORDER_COL, rect.inflate(10,6), 1, border_radius=6)
         screen.blit(surf, rect.move(5,3))
 
-    def cable_color(self):
-        if time.time() < self.flash_err_until:
-            return ERR
-        return (180,180,180)
-
     def handle_click(self, mouse) -> None:
         idx = self.pick(mouse)
         if idx is None: 
@@ -142,16 +251,20 @@ class PlugArea:
                 # type check
                 a = self.ports[self.pending]; b = self.ports[idx]
                 if a.ptype == b.ptype:
-                    self.cables.append(Cable(self.pending, idx))
+                    self.add_cable(self.pending, idx)
                 else:
-                    self.flash_err_until = time.time() + 0.6
+                    self.flash_err_until = time.perf_counter() + 0.6
                 self.pending = None
 
     def pick(self, mouse) -> Optional[int]:
-        for i,p in enumerate(self.ports):
-            if (p.pos[0]-mouse[0])**2 + (p.pos[1]-mouse[1])**2 <= p.radius*p.radius:
-                return i
-        return None
+        # vectorized squared-distance test over the SoA arrays (C loop, not Python)
+        if not self.ports:
+            return None
+        dx = self._px - mouse[0]
+        dy = self._py - mouse[1]
+        mask = dx*dx + dy*dy <= self._pr*self._pr
+        i = int(mask.argmax())
+        return i if mask[i] else None
 
     def find_cable_between(self, a_name, b_name) -> Optional[int]:
         ai = next((i for i,p in enumerate(self.ports) if p.name==a_name), None)
@@ -164,6 +277,7 @@ class PlugArea:
 
 # -------------------- Cycling Unit (Timing) --------------------
 WAVES = ["CPP","10P","9P","8P","7P","6P","5P","4P","3P","2P","1P","CCG","RP"]
+WAVES_LABELS = [render_cached(FONT_SM, name, TEXT) for name in WAVES]
 class CyclingUnit:
     def __init__(self, rect: pygame.Rect):
         self.rect = rect
@@ -172,67 +286,71 @@ class CyclingUnit:
         self.cursor = 0     # 0..9; represents pulse index inside add-time
         self.speed = 0.5    # seconds per pulse (RUN)
         self._acc = 0.0
+        # geometry fixed for the widget's life: slider track and the ten
+        # master-programmer ring lamp centers (sprite topleft coords)
+        self._slider = (self.rect.x+220, self.rect.bottom-36, 240, 10)
+        cx, cy, r = self.rect.right-120, self.rect.y+50, 36
+        self._ring_pts = [(int(cx + r*math.cos(RING_START + 2*math.pi*i/10)) - 8,
+                           int(cy + r*math.sin(RING_START + 2*math.pi*i/10)) - 8)
+                          for i in range(10)]
+        # panel chrome, waveform rails and row labels never change: bake once
+        self._static = self._build_static()
+
+    def _build_static(self):
+        surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        local = surf.get_rect()
+        pygame.draw.rect(surf, PANEL_DARK, local, border_radius=8)
+        pygame.draw.rect(surf, BORDER_COL, local, 1, border_radius=8)
+        surf.blit(render_cached(FONT_BIG, "Cycling unit", TEXT), (12, 8))
+        h = self.rect.height - 60
+        row_h = h/len(WAVES)
+        start_x, end_x = 80, local.width - 16
+        for i in range(len(WAVES)):
+            y = int(40 + i*row_h)
+            pygame.draw.line(surf, RAIL_COL, (start_x, y), (end_x, y), 1)
+            surf.blit(WAVES_LABELS[i], (12, y-8))
+        return surf.convert_alpha()
 
     def draw(self):
-        pygame.draw.rect(screen, PANEL_DARK, self.rect, border_radius=8)
-        pygame.draw.rect(screen, (40,40,40), self.rect, 1, border_radius=8)
+        # panel + rails + labels come from the baked Surface; only the
+        # cursor, ring lamps and controls are dynamic
+        screen.blit(self._static, self.rect.topleft)
 
-        # Titles and mode
-        t = FONT_BIG.render("Cycling unit", True, TEXT)
-        screen.blit(t, (self.rect.x+12, self.rect.y+8))
-
-        # Draw waveform rails
-        h = self.rect.height - 60
-        row_h = h/len(WAVES)
+        # cursor
         start_x = self.rect.x + 80
         end_x = self.rect.right - 16
-        for i,name in enumerate(WAVES):
-            y = int(self.rect.y + 40 + i*row_h)
-            pygame.draw.line(screen, (120,120,120), (start_x, y), (end_x, y), 1)
-            lab = FONT_SM.render(name, True, TEXT)
-            screen.blit(lab, (self.rect.x + 12, y-8))
-            # draw pulses: for 10P..1P, place a tick at a phase slot
-            if name.endswith("P") and len(name)==2 or len(name)==3 and name[0].isdigit():
-                pass # decorative only for now
-        # cursor
         x = int(start_x + (end_x-start_x)*(self.cursor/10))
-        pygame.draw.line(screen, (255,120,120), (x, self.rect.y+36), (x, self.rect.bottom-12), 2)
+        pygame.draw.line(screen, CURSOR_COL, (x, self.rect.y+36), (x, self.rect.bottom-12), 2)
 
         # Master Programmer ring
-        self.draw_ring(self.rect.right-120, self.rect.y+50, self.cursor)
+        self.draw_ring(self.cursor)
 
         # controls
         self.draw_controls()
 
-    def draw_ring(self, cx, cy, index):
-        # 10 lamps in a ring
-        r = 36
-        for i in range(10):
-            ang = -math.pi/2 + 2*math.pi*i/10
-            x = int(cx + r*math.cos(ang))
-            y = int(cy + r*math.sin(ang))
-            on = (i == index)
-            pygame.draw.circle(screen, (90, 220, 120) if on else (80,80,80), (x,y), 7)
-            pygame.draw.circle(screen, (35,35,35), (x,y), 7, 1)
+    def draw_ring(self, index):
+        # 10 lamps in a ring, positions precomputed in __init__
+        for i, pos in enumerate(self._ring_pts):
+            screen.blit(RING_ON if i == index else RING_OFF, pos)
 
     def draw_controls(self):
         # Mode status
-        s = FONT.render(f"mode: {self.mode}  run: {'ON' if self.running else 'OFF'}", True, TEXT)
+        s = render_cached(FONT, f"mode: {self.mode}  run: {'ON' if self.running else 'OFF'}", TEXT)
         screen.blit(s, (self.rect.x+12, self.rect.bottom-28))
         # slider
-        sx, sy, sw, sh = self.rect.x+220, self.rect.bottom-36, 240, 10
-        pygame.draw.rect(screen, (180,180,180), (sx, sy, sw, sh), border_radius=5)
+        sx, sy, sw, sh = self._slider
+        pygame.draw.rect(screen, SLIDER_COL, (sx, sy, sw, sh), border_radius=5)
         knob_x = sx + int(sw * (1.0 - max(0.05, min(1.5, self.speed))/1.5)) # faster → right
-        pygame.draw.circle(screen, (230,230,230), (knob_x, sy+sh//2), 9)
-        lab = FONT_SM.render("speed (s/pulse)", True, TEXT)
+        pygame.draw.circle(screen, KNOB_COL, (knob_x, sy+sh//2), 9)
+        lab = render_cached(FONT_SM, "speed (s/pulse)", TEXT)
         screen.blit(lab, (sx, sy-18))
 
     def slider_hit(self, pos)->bool:
-        sx, sy, sw, sh = self.rect.x+220, self.rect.bottom-36, 240, 10
+        sx, sy, sw, sh = self._slider
         return pygame.Rect(sx-8, sy-8, sw+16, sh+16).collidepoint(pos)
 
     def slider_set(self, posx):
-        sx, sy, sw, sh = self.rect.x+220, self.rect.bottom-36, 240, 10
+        sx, sy, sw, sh = self._slider
         t = (posx - sx)/sw
         t = max(0.0, min(1.0, t))
         self.speed = 1.5 * (1.0 - t) + 0.05
@@ -258,53 +376,57 @@ class CyclingUnit:
 class ConstantTx:
     def __init__(self, rect: pygame.Rect, digits: List[int]):
         self.rect = rect
-        self.digits = digits[:]  # 10 digits
+        self.digits = np.array(digits, dtype=np.uint8)  # 10 digits
         self.port_A = None  # added to PlugArea externally
 
     def draw(self):
         draw_panel(self.rect, "Constant Transmitter")
         ds = ''.join(str(d) for d in self.digits)
-        t = FONT_BIG.render(ds, True, OK)
+        t = render_cached(FONT_BIG, ds, OK)
         screen.blit(t, (self.rect.x + 18, self.rect.y + 52))
 
 class Accumulator:
     def __init__(self, rect: pygame.Rect, name="A1"):
         self.rect = rect
         self.name = name
-        self.digits = [0]*10
+        self.digits = np.zeros(10, dtype=np.uint8)
         self.sign = '+'
         # ports will be placed in PlugArea (α input, A/S/AS outputs)
         self.port_alpha = None
         self.port_A = None
         self.port_S = None
         self.port_AS = None
+        # decade-lamp blit positions (sprite topleft), fixed for the panel's life
+        self.lamp_positions = [(self.rect.x + 16 + i*24 - 8, self.rect.y + 90 - 8)
+                               for i in range(10)]
 
     def reset(self):
-        self.digits = [0]*10
+        self.digits = np.zeros(10, dtype=np.uint8)
         self.sign = '+'
 
     def draw(self, active_index: Optional[int] = None):
         draw_panel(self.rect, f"Accumulator {self.name}")
         ds = ''.join(str(d) for d in self.digits)
-        t = FONT_BIG.render(f"{self.sign}{ds}", True, OK if active_index is not None else TEXT)
+        t = render_cached(FONT_BIG, f"{self.sign}{ds}", OK if active_index is not None else TEXT)
         screen.blit(t, (self.rect.x + 16, self.rect.y + 40))
-        # decade lamps
-        base_x, y = self.rect.x + 16, self.rect.y + 90
-        for i,d in enumerate(self.digits):
-            cx = base_x + i*24
-            color = (250,240,120) if (active_index is not None and i==active_index) else (90,90,90)
-            pygame.draw.circle(screen, color, (cx, y), 7)
-            pygame.draw.circle(screen, (35,35,35), (cx, y), 7, 1)
+        # decade lamps (cached sprites, blit only)
+        for i, pos in enumerate(self.lamp_positions):
+            screen.blit(LAMP_ON if i == active_index else LAMP_OFF, pos)
 
     def add_pulse_column(self, col_value:int, index:int):
         """Add a single column value (0..9) at digit index (0..9, MSB..LSB)."""
-        i = index
-        carry = col_value
-        while i >= 0 and carry>0:
-            s = self.digits[i] + carry
-            self.digits[i] = s % 10
+        _add_col(self.digits, int(col_value), index)
+
+    def add_digits(self, addend: np.ndarray):
+        """Add a full 10-digit column vector in one vectorized step
+        followed by a single right-to-left carry pass."""
+        total = self.digits.astype(np.int16) + addend
+        carry = 0
+        for i in range(9, -1, -1):
+            s = int(total[i]) + carry
+            total[i] = s % 10
             carry = s // 10
-            i -= 1
+        self.digits = total.astype(np.uint8)
 
 # -------------------- Simulator Wiring & Logic --------------------
 class Simulator:
@@ -325,13 +447,35 @@ class Simulator:
         self.btn_mode_pulse = Button(pygame.Rect(980, 150, 120, 28), "one-pulse")
         self.btn_mode_add = Button(pygame.Rect(1110, 150, 120, 28), "one-add")
 
-        # Cable animation (data)
+        # Cable animation (data) — fixed-step integer counter so the pulse
+        # travel is deterministic regardless of frame-rate jitter
         self.anim_cable_idx = None
-        self.anim_t = 0.0
+        self.anim_step = 0
+        self.anim_total = 1
 
         # Control ports visual (CCG/RP)
         self.ctrl_flash = False
 
+        # Per-frame mouse state: queried once in update(); hover is re-picked
+        # only on frames that actually saw a MOUSEMOTION event
+        self._mouse = (0, 0)
+        self._hover = None
+        self._mouse_dirty = True
+
+        # Static scenery (bg fill, toolbar, plugboard panel + grid) baked once:
+        # one blit per frame instead of dozens of SDL draw calls
+        self.static_bg = self._build_static_bg()
+
+    def _build_static_bg(self):
+        bg = pygame.Surface((W, H)).convert()
+        bg.fill(BG)
+        pygame.draw.rect(bg, TOOLBAR_COL, (0,0,W,36))
+        pb_rect = pygame.Rect(20, 430, W-40, 360)
+        draw_panel(pb_rect, "Plugboard & Ports", surface=bg)
+        for y in range(pb_rect.y+40, pb_rect.bottom-10, 26):
+            pygame.draw.line(bg, GRID, (pb_rect.x+10,y), (pb_rect.right-10,y), 1)
+        return bg
+
     def build_ports(self):
         # Place named ports similar to screenshot around bottom area
         # CT A (data out)
@@ -346,34 +490,25 @@ class Simulator:
         self.plugs.add_port("CCG", (140, 600), "ctrl", "CTRL")
         self.plugs.add_port("RP",  (220, 600), "ctrl", "CTRL")
         # Connect default demo wire CT.A -> A1.α for immediate use
-        self.plugs.cables.append(Cable(0,1))
+        self.plugs.add_cable(0, 1)
 
     def draw(self, dt):
-        screen.fill(BG)
-        # Top toolbar (visual)
-        pygame.draw.rect(screen, (192,192,192), (0,0,W,36))
+        screen.blit(self.static_bg, (0,0))
         # Panels
         self.ct.draw()
         self.acc.draw(active_index=self.cycling.cursor if (self.anim_cable_idx is not None) else None)
         self.cycling.draw()
 
-        # Plug area box
-        pb_rect = pygame.Rect(20, 430, W-40, 360)
-        draw_panel(pb_rect, "Plugboard & Ports")
-        # grid lines for style
-        for y in range(pb_rect.y+40, pb_rect.bottom-10, 26):
-            pygame.draw.line(screen, GRID, (pb_rect.x+10,y), (pb_rect.right-10,y), 1)
-
-        hover = self.plugs.pick(pygame.mouse.get_pos())
-        self.plugs.draw(hover_idx=hover)
+        self.plugs.draw(hover_idx=self._hover)
 
         # Cable anim if active
         if self.anim_cable_idx is not None:
             cab = self.plugs.cables[self.anim_cable_idx]
             a = self.plugs.ports[cab.a_idx].pos
             b = self.plugs.ports[cab.b_idx].pos
-            x = int(a[0] + (b[0]-a[0])*self.anim_t)
-            y = int(a[1] + (b[1]-a[1])*self.anim_t)
+            t = self.anim_step / self.anim_total
+            x = int(a[0] + (b[0]-a[0])*t)
+            y = int(a[1] + (b[1]-a[1])*t)
             pygame.draw.circle(screen, (255,255,255), (x,y), 7)
             pygame.draw.circle(screen, ACCENT, (x,y), 9, 2)
 
@@ -392,7 +527,7 @@ class Simulator:
             "In one-add/run, a full add-time transfers CT to Accumulator."
         ]
         for i,s in enumerate(info):
-            t = FONT_SM.render(s, True, TEXT)
+            t = render_cached(FONT_SM, s, TEXT)
             screen.blit(t, (24, 400 + i*18))
 
     def handle(self, e):
@@ -414,8 +549,9 @@ class Simulator:
             # Ports
             self.plugs.handle_click(e.pos)
 
-        if e.type == pygame.MOUSEMOTION and pygame.mouse.get_pressed()[0]:
-            if self.cycling.slider_hit(e.pos):
+        if e.type == pygame.MOUSEMOTION:
+            self._mouse_dirty = True
+            if pygame.mouse.get_pressed()[0] and self.cycling.slider_hit(e.pos):
                 self.cycling.slider_set(e.pos[0])
 
         if e.type == pygame.KEYDOWN:
@@ -430,7 +566,7 @@ class Simulator:
         self.cycling.cursor = 0
         self.acc.reset()
         self.anim_cable_idx = None
-        self.anim_t = 0.0
+        self.anim_step = 0
 
     def step_action(self):
         if self.cycling.mode == "ONE-PULSE":
@@ -449,7 +585,9 @@ class Simulator:
     def anim_start_for(self, src_name, dst_name):
         idx = self.plugs.find_cable_between(src_name, dst_name)
         self.anim_cable_idx = idx
-        self.anim_t = 0.0
+        self.anim_step = 0
+        # duration in whole frames, scaled by the speed slider
+        self.anim_total = max(1, int(self.cycling.speed * 60))
 
     def trigger_single_pulse(self):
         # Single pulse at current cursor: transfer one column (digit)
@@ -462,13 +600,16 @@ class Simulator:
             self.acc.add_pulse_column(digit, col_idx)
 
     def transfer_add_time(self):
-        # apply all 10 pulses (MSD..LSD)
-        for i in range(10):
-            digit = self.ct.digits[i]
-            if digit:
-                self.acc.add_pulse_column(digit, i)
+        # apply all 10 pulses (MSD..LSD) as one vectorized column add
+        self.acc.add_digits(self.ct.digits)
 
     def update(self, dt):
+        # one SDL query per frame; hover only re-picked after mouse motion
+        self._mouse = pygame.mouse.get_pos()
+        if self._mouse_dirty:
+            self._hover = self.plugs.pick(self._mouse)
+            self._mouse_dirty = False
+
         # RUN mode auto-progress
         if self.cycling.update_run(dt):
             if self.cycling.mode == "ONE-ADD":
@@ -476,12 +617,12 @@ class Simulator:
             else:
                 self.trigger_single_pulse()
 
-        # advance cable anim
+        # advance cable anim one fixed step per frame
         if self.anim_cable_idx is not None:
-            self.anim_t += max(0.3*dt/self.cycling.speed, 0.01)
-            if self.anim_t >= 1.0:
+            self.anim_step += 1
+            if self.anim_step >= self.anim_total:
                 self.anim_cable_idx = None
-                self.anim_t = 0.0
+                self.anim_step = 0
 
 # -------------------- UI Widgets: Buttons --------------------
 class Button:
@@ -493,7 +634,7 @@ class Button:
         col = (230,230,230) if self.enabled else (140,140,140)
         pygame.draw.rect(screen, col, self.rect, border_radius=6)
         pygame.draw.rect(screen, (30,30,30), self.rect, 1, border_radius=6)
-        t = FONT.render(self.text, True, (22,22,22))
+        t = render_cached(FONT, self.text, (22,22,22))
         screen.blit(t, t.get_rect(center=self.rect.center))
     def handle(self, e)->bool:
         return self.enabled and e.type==pygame.MOUSEBUTTONDOWN and e.button==1 and self.rect.collidepoint(e.pos)
@@ -501,23 +642,36 @@ class Button:
 # -------------------- Main Loop --------------------
 def main():
     sim = Simulator()
-    last = time.time()
+    last = time.perf_counter()
     while True:
-        now = time.time()
+        now = time.perf_counter()
         dt = now - last; last = now
 
+        # coalesce MOUSEMOTION: high-rate mice can flood hundreds of motion
+        # events per frame; only the last one matters for hover/drag state
+        last_motion = None
         for e in pygame.event.get():
+            if e.type == pygame.MOUSEMOTION:
+                last_motion = e
+                continue
             if e.type == pygame.QUIT:
                 pygame.quit(); sys.exit(0)
             if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
                 pygame.quit(); sys.exit(0)
             sim.handle(e)
+        if last_motion is not None:
+            sim.handle(last_motion)
 
         sim.update(dt)
         sim.draw(dt)
 
         pygame.display.flip()
-        clock.tick(60)
+        if VSYNC:
+            clock.tick(0)   # vsync paces the frame; tick only measures dt
+        else:
+            # tick() sleeps via SDL_Delay (~10 ms granularity on some
+            # platforms); busy-looping the tail gives stable 60 fps pacing
+            clock.tick_busy_loop(60)
 
 if __name__ == "__main__":
     main()
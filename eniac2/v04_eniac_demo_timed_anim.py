@@ -32,6 +32,11 @@ screen = pygame.display.set_mode((W, H))
 pygame.display.set_caption("ENIAC Demo — Timed + Cable Animation")
 clock = pygame.time.Clock()
 
+# The loop only reacts to QUIT and KEYDOWN; keep everything else
+# (mouse motion in particular) out of the event queue.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
 # ---------- theme ----------
 BG = (54,56,60)
 PANEL = (82,84,88)
@@ -58,34 +63,57 @@ class LabelBox:
         self.rect = pygame.Rect(rect)
         self.title = title
         self.get_value = get_value
+        self._cached_value = None
+        self._cached_surf = None
     def draw(self):
         draw_panel(self.rect, self.title)
         val = self.get_value()
-        t = FONT_BIG.render(str(val), True, OK)
-        screen.blit(t, (self.rect.x+12, self.rect.y+40))
+        if val != self._cached_value:
+            self._cached_value = val
+            self._cached_surf = FONT_BIG.render(str(val), True, OK)
+        screen.blit(self._cached_surf, (self.rect.x+12, self.rect.y+40))
 
 class Acc:
     def __init__(self, name, pos):
         self.name = name
         self.pos = pos
         self.digits = [0]*10
+        self._int_value = 0
+        self._digit_surf = None
+        self._panel = self._build_panel()
+    def _build_panel(self):
+        """Panel frame, title and all-off lamps, baked once."""
+        rect = pygame.Rect(0, 0, 210, 88)
+        surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(surf, PANEL, rect, border_radius=8)
+        pygame.draw.rect(surf, (30,30,30), rect, 1, border_radius=8)
+        t = FONT_BIG.render(f"Acc {self.name}", True, TEXT)
+        surf.blit(t, (10, 8))
+        for i in range(10):
+            x = 12+i*20
+            pygame.draw.circle(surf, (80,80,80), (x,28), 6)
+            pygame.draw.circle(surf, (35,35,35), (x,28), 6, 1)
+        return surf.convert_alpha()
     def load(self, v:int):
-        s = f"{v:010d}"
-        self.digits = [int(ch) for ch in s]
+        self._int_value = v % 10_000_000_000   # ten decades
+        digits = [0]*10
+        for i in range(9, -1, -1):
+            v, digits[i] = divmod(v, 10)
+        self.digits = digits
+        self._digit_surf = None
     def value(self)->int:
-        return int("".join(map(str,self.digits)))
+        return self._int_value
     def draw(self, active_idx: Optional[int]=None):
-        rect = pygame.Rect(self.pos[0], self.pos[1], 210, 88)
-        draw_panel(rect, f"Acc {self.name}")
-        s = "".join(map(str,self.digits))
-        t = FONT_BIG.render(s, True, OK)
-        screen.blit(t, (rect.x+12, rect.y+42))
-        # decade lamps
-        y = rect.y+28
-        for i in range(10):
-            x = rect.x+12+i*20
-            on = (active_idx==i)
-            pygame.draw.circle(screen, (250,240,140) if on else (80,80,80), (x,y), 6)
+        x0, y0 = self.pos
+        screen.blit(self._panel, (x0, y0))
+        if self._digit_surf is None:
+            s = "".join(map(str,self.digits))
+            self._digit_surf = FONT_BIG.render(s, True, OK)
+        screen.blit(self._digit_surf, (x0+12, y0+42))
+        # only the active decade lamp needs painting over the baked panel
+        if active_idx is not None:
+            x, y = x0+12+active_idx*20, y0+28
+            pygame.draw.circle(screen, (250,240,140), (x,y), 6)
             pygame.draw.circle(screen, (35,35,35), (x,y), 6, 1)
 
 class CT:
@@ -93,16 +121,22 @@ class CT:
         self.name = name
         self.pos = pos
         self.value = 0
-    def load(self, v:int): self.value = v
+        self._value_surf = None
+    def load(self, v:int):
+        self.value = v
+        self._value_surf = None
     def digits(self)->List[int]:
-        s = f"{self.value:010d}"
-        return [int(ch) for ch in s]
+        v = self.value
+        out = [0]*10
+        for i in range(9, -1, -1):
+            v, out[i] = divmod(v, 10)
+        return out
     def draw(self, active_idx: Optional[int]=None):
         rect = pygame.Rect(self.pos[0], self.pos[1], 150, 70)
         draw_panel(rect, f"{self.name}")
-        s = str(self.value)
-        t = FONT_BIG.render(s, True, OK)
-        screen.blit(t, (rect.x+10, rect.y+38))
+        if self._value_surf is None:
+            self._value_surf = FONT_BIG.render(str(self.value), True, OK)
+        screen.blit(self._value_surf, (rect.x+10, rect.y+38))
         # decade lamps row
         y = rect.y+26
         for i in range(10):
@@ -128,35 +162,48 @@ class Plugboard:
     def __init__(self):
         self.ports: List[Port] = []
         self.cables: List[Cable] = []
+        self._port_index = {}   # name -> index, avoids linear scans
     def add_port(self, name, pos, ptype):
+        self._port_index[name] = len(self.ports)
         self.ports.append(Port(name, pos, ptype))
     def add_cable(self, a_name, b_name):
         ai = self._find_port(a_name); bi = self._find_port(b_name)
         kind = self.ports[ai].ptype
         self.cables.append(Cable(ai, bi, kind))
     def _find_port(self, name)->int:
-        for i,p in enumerate(self.ports):
-            if p.name == name: return i
-        raise KeyError(name)
-    def draw(self, active_paths: List[Tuple[str,str]], tphase: float):
-        # Draw cables
+        return self._port_index[name]
+    def bake(self, rect):
+        """Pre-render cables and ports into a static overlay for `rect`.
+
+        The wiring never changes after setup, so drawing every cable and
+        port per frame is wasted work — only the pulses stay dynamic.
+        """
+        self._rect = pygame.Rect(rect)
+        surf = pygame.Surface(self._rect.size, pygame.SRCALPHA)
+        ox, oy = self._rect.topleft
+        # grid lines (under the cables)
+        for y in range(36, self._rect.height - 8, 26):
+            pygame.draw.line(surf, (120,120,124), (8,y), (self._rect.width-8,y), 1)
         for c in self.cables:
             a = self.ports[c.a]; b = self.ports[c.b]
             color = (180,180,180)
-            pygame.draw.line(screen, color, a.pos, b.pos, 5)
-        # Draw ports
+            pygame.draw.line(surf, color, (a.pos[0]-ox, a.pos[1]-oy), (b.pos[0]-ox, b.pos[1]-oy), 5)
         for p in self.ports:
-            pygame.draw.circle(screen, (18,18,18), p.pos, 7)
-            pygame.draw.circle(screen, (200,200,200), p.pos, 7, 1)
-        # Animate pulses along active paths
-        for (a_name,b_name) in active_paths:
-            try:
-                ai = self._find_port(a_name); bi = self._find_port(b_name)
-            except KeyError:
-                continue
-            a = self.ports[ai]; b = self.ports[bi]
-            x = int(a.pos[0] + (b.pos[0]-a.pos[0])*tphase)
-            y = int(a.pos[1] + (b.pos[1]-a.pos[1])*tphase)
+            lx, ly = p.pos[0]-ox, p.pos[1]-oy
+            pygame.draw.circle(surf, (18,18,18), (lx,ly), 7)
+            pygame.draw.circle(surf, (200,200,200), (lx,ly), 7, 1)
+        self._static = surf.convert_alpha()
+    def resolve(self, pairs: List[Tuple[str,str]]) -> List[Tuple[Tuple[int,int],Tuple[int,int]]]:
+        """Turn (port name, port name) pairs into endpoint positions."""
+        return [(self.ports[self._find_port(a)].pos, self.ports[self._find_port(b)].pos)
+                for a, b in pairs]
+    def draw(self, active_paths: List[Tuple[Tuple[int,int],Tuple[int,int]]], tphase: float):
+        # Static cables and ports
+        screen.blit(self._static, self._rect.topleft)
+        # Animate pulses along active paths (already resolved to positions)
+        for (apos, bpos) in active_paths:
+            x = int(apos[0] + (bpos[0]-apos[0])*tphase)
+            y = int(apos[1] + (bpos[1]-apos[1])*tphase)
             pygame.draw.circle(screen, (255,255,255), (x,y), 6)
             pygame.draw.circle(screen, ACCENT, (x,y), 9, 2)
 
@@ -168,28 +215,40 @@ class Timing:
         self.cursor = 0         # 0..9 for 10P..1P
         self.running = False
         self.speed = 0.35       # seconds per pulse
+        self._static = self._build_static()
+        # ring lamp centres never move; no trig per frame
+        cx, cy, r = self.rect.right-70, self.rect.y+60, 32
+        self._ring = []
+        for i in range(10):
+            ang = -math.pi/2 + 2*math.pi*i/10
+            self._ring.append((int(cx + r*math.cos(ang)), int(cy + r*math.sin(ang))))
+    def _build_static(self):
+        """Panel background, rails and labels never change — bake them once."""
+        surf = pygame.Surface(self.rect.size)
+        surf.fill(BG)
+        local = surf.get_rect()
+        pygame.draw.rect(surf, PANEL, local, border_radius=8)
+        pygame.draw.rect(surf, (30,30,30), local, 1, border_radius=8)
+        h = self.rect.height - 50
+        row_h = h/len(WAVES)
+        start_x = 80
+        end_x = local.right - 16
+        for i,name in enumerate(WAVES):
+            y = int(36 + i*row_h)
+            pygame.draw.line(surf, (120,120,120), (start_x,y), (end_x,y), 1)
+            lab = FONT_SM.render(name, True, TEXT); surf.blit(lab, (10, y-8))
+        return surf.convert()
     def draw(self, stage_name:str):
-        pygame.draw.rect(screen, PANEL, self.rect, border_radius=8)
-        pygame.draw.rect(screen, (30,30,30), self.rect, 1, border_radius=8)
+        screen.blit(self._static, self.rect.topleft)
         t = FONT_BIG.render(f"Timing — stage: {stage_name}", True, TEXT)
         screen.blit(t, (self.rect.x+10, self.rect.y+8))
-        h = self.rect.height - 50
-        row_h = h/len(WAVES)
         start_x = self.rect.x + 80
         end_x = self.rect.right - 16
-        # rails
-        for i,name in enumerate(WAVES):
-            y = int(self.rect.y + 36 + i*row_h)
-            pygame.draw.line(screen, (120,120,120), (start_x,y), (end_x,y), 1)
-            lab = FONT_SM.render(name, True, TEXT); screen.blit(lab, (self.rect.x+10, y-8))
         # cursor for digits (10P..1P)
         x = int(start_x + (end_x-start_x)*(self.cursor/10))
         pygame.draw.line(screen, (255,120,120), (x, self.rect.y+30), (x, self.rect.bottom-10), 2)
         # ring lamps 0..9
-        cx, cy, r = self.rect.right-70, self.rect.y+60, 32
-        for i in range(10):
-            ang = -math.pi/2 + 2*math.pi*i/10
-            px = int(cx + r*math.cos(ang)); py = int(cy + r*math.sin(ang))
+        for i,(px,py) in enumerate(self._ring):
             on = (i==self.cursor)
             pygame.draw.circle(screen, (90,220,120) if on else (80,80,80), (px,py), 7)
             pygame.draw.circle(screen, (35,35,35), (px,py), 7, 1)
@@ -216,13 +275,38 @@ class Demo:
         # plugboard
         self.pb = Plugboard()
         self._build_ports_and_cables()
+        self.pb_rect = pygame.Rect(20, 320, 1280, 380)
+        self.pb.bake(self.pb_rect)
+        # Resolve the per-stage pulse paths to positions once, not per frame.
+        self._stage_paths = [
+            self.pb.resolve([("CT1.A","A1.α"), ("CT2.A","A2.α"), ("CT3.A","A3.α")]),
+            self.pb.resolve([("A2.A","MULT.IN1"), ("A3.A","MULT.IN2"), ("MULT.OUT","A4.α")]),
+            self.pb.resolve([("A1.A","A5.α"), ("A4.A","A5.α")]),
+            [],     # punch stage is visual only
+            [],
+        ]
 
         # sequence state
         self.stage = 0      # 0: load, 1: multiply, 2: add, 3: punch, 4: done
         self.tphase = 0.0   # 0.0..1.0 along cable
         self.running = False
+        self._acc = 0.0     # run-mode pulse accumulator; update() reads it
+        self.dirty = True        # something changed since the last frame drawn
+        self.full_redraw = True  # False when only the pulse animation moved
         self._last = time.time()
 
+        # UI hint lines: all static except the stage/cursor line (index 3),
+        # which is re-rendered only when stage or cursor changes.
+        self._tip_surfs = [
+            FONT.render("ENTER = STEP (one digit pulse)", True, TEXT),
+            FONT.render("SPACE = RUN/PAUSE", True, TEXT),
+            FONT.render("R = Reset", True, TEXT),
+            None,
+            FONT.render("Flow: LOAD (CT->A1..3) → MULTIPLY (A2,A3->A4) → ADD (A1+A4->A5) → PUNCH", True, TEXT),
+        ]
+        self._tip_state = None
+        self._tip_dyn = None
+
     def _build_ports_and_cables(self):
         # Data ports (left to right rough layout under units)
         # CT outputs
@@ -297,20 +381,17 @@ class Demo:
         if self.timing.cursor == 0:
             if self.stage < 3:
                 self.stage += 1
+        self.dirty = True
+        self.full_redraw = True
 
-    def active_paths(self)->List[Tuple[str,str]]:
-        """Return list of cable names that should show a pulse right now."""
-        if self.stage == 0:
-            return [("CT1.A","A1.α"), ("CT2.A","A2.α"), ("CT3.A","A3.α")]
-        if self.stage == 1:
-            return [("A2.A","MULT.IN1"), ("A3.A","MULT.IN2"), ("MULT.OUT","A4.α")]
-        if self.stage == 2:
-            return [("A1.A","A5.α"), ("A4.A","A5.α")]
-        if self.stage == 3:
-            return [("A5.A","PUNCH.IN")] if False else []  # visual only
-        return []
+    def active_paths(self)->List[Tuple[Tuple[int,int],Tuple[int,int]]]:
+        """Return the resolved cable endpoints that should show a pulse right now."""
+        return self._stage_paths[self.stage]
 
     def update(self, dt):
+        # paused with the animation settled: nothing to advance
+        if not self.running and self.tphase >= 1.0:
+            return
         # run mode
         if self.running:
             self._acc += dt
@@ -318,8 +399,9 @@ class Demo:
                 self._acc = 0.0
                 self.do_pulse()
         # animate tphase along active path(s)
-        self.tphase += dt / max(0.15, self.timing.speed)
-        if self.tphase > 1.0: self.tphase = 1.0
+        if self.tphase < 1.0:
+            self.tphase = min(1.0, self.tphase + dt / max(0.15, self.timing.speed))
+            self.dirty = True
 
     def reset(self):
         self.stage = 0
@@ -328,6 +410,8 @@ class Demo:
         self.ct1.load(0); self.ct2.load(0); self.ct3.load(0)
         self.tphase = 0.0
         self._acc = 0.0
+        self.dirty = True
+        self.full_redraw = True
 
     # ---------- draw ----------
     def draw(self):
@@ -345,11 +429,7 @@ class Demo:
         self.mult.draw(); self.punch.draw()
 
         # plugboard region
-        pb_rect = pygame.Rect(20, 320, 1280, 380)
-        draw_panel(pb_rect, "Plugboard & Ports (animated)")
-        # grid lines
-        for y in range(pb_rect.y+36, pb_rect.bottom-8, 26):
-            pygame.draw.line(screen, (120,120,124), (pb_rect.x+8,y), (pb_rect.right-8,y), 1)
+        draw_panel(self.pb_rect, "Plugboard & Ports (animated)")
 
         # draw plugs/cables with active paths
         self.pb.draw(self.active_paths(), self.tphase)
@@ -358,16 +438,13 @@ class Demo:
         self.timing.draw(self.stage_name())
 
         # UI hints
-        tips = [
-            "ENTER = STEP (one digit pulse)",
-            "SPACE = RUN/PAUSE",
-            "R = Reset",
-            f"Stage: {self.stage_name()}  |  Cursor: {self.timing.cursor}",
-            "Flow: LOAD (CT->A1..3) → MULTIPLY (A2,A3->A4) → ADD (A1+A4->A5) → PUNCH"
-        ]
-        for i,s in enumerate(tips):
-            t = FONT.render(s, True, TEXT)
-            screen.blit(t, (20, 290 + i*18))
+        state = (self.stage, self.timing.cursor)
+        if state != self._tip_state:
+            self._tip_state = state
+            self._tip_dyn = FONT.render(
+                f"Stage: {self.stage_name()}  |  Cursor: {self.timing.cursor}", True, TEXT)
+        for i,t in enumerate(self._tip_surfs):
+            screen.blit(t if t is not None else self._tip_dyn, (20, 290 + i*18))
 
 # ---------- main ----------
 def main():
@@ -376,7 +453,15 @@ def main():
     last = time.time()
     while True:
         now = time.time(); dt = now - last; last = now
-        for e in pygame.event.get():
+        # Fully idle (paused, animation settled): block on events instead of
+        # spinning the loop at 60 fps.
+        if not demo.running and demo.tphase >= 1.0 and not demo.dirty:
+            e = pygame.event.wait(250)
+            events = ([e] if e.type != pygame.NOEVENT else []) + pygame.event.get()
+            last = time.time()
+        else:
+            events = pygame.event.get()
+        for e in events:
             if e.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             if e.type == pygame.KEYDOWN:
@@ -390,8 +475,15 @@ def main():
                 if e.key == pygame.K_r:
                     demo.reset()
         demo.update(dt)
-        demo.draw()
-        pygame.display.flip()
+        if demo.dirty:
+            demo.draw()
+            if demo.full_redraw:
+                pygame.display.flip()
+            else:
+                # only the pulse animation moved; push just the plugboard
+                pygame.display.update(demo.pb_rect)
+            demo.dirty = False
+            demo.full_redraw = False
         clock.tick(60)
 
 if __name__ == "__main__":
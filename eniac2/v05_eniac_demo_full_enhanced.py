@@ -25,14 +25,25 @@ Run:
     python eniac_demo_full_enhanced.py
 """
 
-import sys, time, math
+import sys, math, functools
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+import numpy as np
 import pygame
 pygame.init()
 W, H = 1360, 940
-screen = pygame.display.set_mode((W, H))
+# Prefer a vsync-synced display; fall back when the driver refuses.
+try:
+    screen = pygame.display.set_mode((W, H), pygame.SCALED, vsync=1)
+except pygame.error:
+    screen = pygame.display.set_mode((W, H))
+# is_vsync() is a pygame-ce addition; probe it separately so upstream
+# pygame (AttributeError) just means "assume no vsync".
+try:
+    VSYNC = bool(pygame.display.is_vsync())
+except Exception:
+    VSYNC = False
 pygame.display.set_caption("ENIAC Demo — Full Enhanced")
 clock = pygame.time.Clock()
 
@@ -50,6 +61,26 @@ FONT = pygame.font.SysFont("consolas,menlo,dejavusansmono,monospace", 16)
 FONT_SM = pygame.font.SysFont("consolas,menlo,dejavusansmono,monospace", 13)
 FONT_BIG = pygame.font.SysFont("consolas,menlo,dejavusansmono,monospace", 20, bold=True)
 
+# Pre-rendered glyphs for the numeric readouts (sign, digits, space).
+# The font is monospace, so strings can be blitted glyph by glyph instead
+# of rasterizing the whole string through FreeType every frame.
+GLYPHS_BIG = {ch: FONT_BIG.render(ch, True, OK).convert_alpha() for ch in "+-0123456789 "}
+GLYPHS_TEXT = {ch: FONT_BIG.render(ch, True, TEXT).convert_alpha() for ch in "+-0123456789 "}
+
+def draw_text_cached(surface, s, pos, glyphs):
+    """Blit a sign/digit string from pre-rendered glyphs."""
+    x, y = pos
+    w = glyphs['0'].get_width()
+    for i, ch in enumerate(s):
+        g = glyphs.get(ch)
+        if g is not None:
+            surface.blit(g, (x + i*w, y))
+
+@functools.lru_cache(maxsize=32)
+def render_line(s):
+    """Memoized FONT.render for UI lines that repeat across frames."""
+    return FONT.render(s, True, TEXT).convert_alpha()
+
 def draw_panel(rect, title=None):
     pygame.draw.rect(screen, PANEL, rect, border_radius=8)
     pygame.draw.rect(screen, (30,30,30), rect, 1, border_radius=8)
@@ -58,41 +89,43 @@ def draw_panel(rect, title=None):
         screen.blit(t, (rect.x + 10, rect.y + 8))
 
 # --------- utility ---------
+_POW10 = tuple(10**k for k in range(20))
+
 def digits10(n:int)->List[int]:
     s = f"{abs(n):010d}"
     return [int(ch) for ch in s]
 
-def from_digits(ds:List[int])->int:
-    return int("".join(map(str, ds)))
-
 # --------- Units ---------
 class Acc:
     def __init__(self, name, pos):
         self.name = name
         self.pos = pos
-        self.digits = [0]*10
-        self.sign = '+'
+        self._v = 0           # value lives as a plain int; digits are display-only
+        self._digits = None
     def load(self, v:int):
-        if v < 0:
-            self.sign = '-'; v = -v
-        else:
-            self.sign = '+'
-        self.digits = digits10(v)
+        self._v = v
+        self._digits = None
     def value(self)->int:
-        v = from_digits(self.digits)
-        return -v if self.sign=='-' else v
+        return self._v
     def add(self, v:int):
-        total = self.value() + v
-        self.load(total)
+        self._v += v
+        self._digits = None
     def shift_add(self, v:int, shift:int):
-        total = self.value() + v*(10**shift)
-        self.load(total)
+        self._v += v*_POW10[shift]
+        self._digits = None
+    @property
+    def sign(self)->str:
+        return '-' if self._v < 0 else '+'
+    @property
+    def digits(self)->List[int]:
+        if self._digits is None:
+            self._digits = digits10(self._v)
+        return self._digits
     def draw(self, active_idx: Optional[int]=None):
         rect = pygame.Rect(self.pos[0], self.pos[1], 230, 92)
         draw_panel(rect, f"Acc {self.name}")
         s = self.sign + "".join(map(str, self.digits))
-        t = FONT_BIG.render(s, True, OK)
-        screen.blit(t, (rect.x+12, rect.y+46))
+        draw_text_cached(screen, s, (rect.x+12, rect.y+46), GLYPHS_BIG)
         # decade lamps (MSD..LSD)
         y = rect.y+28
         for i in range(10):
@@ -111,9 +144,7 @@ class CT:
     def draw(self, active_idx: Optional[int]=None):
         rect = pygame.Rect(self.pos[0], self.pos[1], 160, 74)
         draw_panel(rect, self.name)
-        s = str(self.value)
-        t = FONT_BIG.render(s, True, OK)
-        screen.blit(t, (rect.x+10, rect.y+40))
+        draw_text_cached(screen, str(self.value), (rect.x+10, rect.y+40), GLYPHS_BIG)
         # decade lamps row
         y = rect.y+26
         for i in range(10):
@@ -130,8 +161,28 @@ class LabelBox:
     def draw(self):
         draw_panel(self.rect, self.title)
         val = self.get_value()
-        t = FONT_BIG.render(str(val), True, TEXT)
-        screen.blit(t, (self.rect.x+12, self.rect.y+42))
+        draw_text_cached(screen, str(val), (self.rect.x+12, self.rect.y+42), GLYPHS_TEXT)
+
+# Pre-rendered lamp sprites: 8 glow levels per port type. Blitting a
+# small sprite palette lets the port loop go through one screen.blits
+# call instead of a draw.circle per port.
+def _make_lamp(ctrl: bool, level: int):
+    glow = level / 7.0
+    col = (18+int(180*glow),18+int(160*glow),12) if ctrl else (18+int(200*glow),18+int(120*glow),18)
+    surf = pygame.Surface((12,12), pygame.SRCALPHA)
+    pygame.draw.circle(surf, col, (6,6), 6)
+    return surf.convert_alpha()
+
+LAMP_SPRITES_DATA = [_make_lamp(False, i) for i in range(8)]
+LAMP_SPRITES_CTRL = [_make_lamp(True, i) for i in range(8)]
+
+def _make_pulse(color):
+    surf = pygame.Surface((20,20), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (255,255,255), (10,10), 6)
+    pygame.draw.circle(surf, color, (10,10), 9, 2)
+    return surf.convert_alpha()
+
+PULSE_SPRITES = {"data": _make_pulse(ACCENT), "ctrl": _make_pulse(CTRL)}
 
 # --------- Ports & Plugboard ---------
 @dataclass
@@ -139,7 +190,6 @@ class Port:
     name: str
     pos: Tuple[int,int]
     ptype: str   # "data" or "ctrl"
-    lamp: float = 0.0
 
 @dataclass
 class Cable:
@@ -151,35 +201,54 @@ class Plugboard:
     def __init__(self):
         self.ports: List[Port] = []
         self.cables: List[Cable] = []
+        self._idx = {}   # name -> index, avoids linear scans
+        # lamp state as SoA arrays: decay and glow colors vectorize
+        self._lamp = np.zeros(0, dtype=np.float32)
+        self._ctrl = np.zeros(0, dtype=bool)
+        # cable endpoints bucketed by kind, rebuilt only when wiring changes
+        self._segments = {"data": [], "ctrl": []}
+        self._segments_dirty = False
     def add_port(self, name, pos, ptype):
+        self._idx[name] = len(self.ports)
         self.ports.append(Port(name, pos, ptype))
+        self._lamp = np.append(self._lamp, np.float32(0.0))
+        self._ctrl = np.append(self._ctrl, ptype == "ctrl")
     def add_cable(self, a_name, b_name):
         ai = self._find_port(a_name); bi = self._find_port(b_name)
         kind = self.ports[ai].ptype
         self.cables.append(Cable(ai, bi, kind))
+        self._segments_dirty = True
+    def _rebuild_segments(self):
+        self._segments = {"data": [], "ctrl": []}
+        for c in self.cables:
+            self._segments[c.kind].append((self.ports[c.a].pos, self.ports[c.b].pos))
+        self._segments_dirty = False
     def _find_port(self, name)->int:
-        for i,p in enumerate(self.ports):
-            if p.name == name: return i
-        raise KeyError(name)
+        return self._idx[name]
+    def lamps_lit(self)->bool:
+        """True while any port lamp is still visibly decaying."""
+        return bool((self._lamp > 0.01).any())
     def pulse_on(self, name, amount=1.0):
         try:
-            i = self._find_port(name)
-            self.ports[i].lamp = 1.0
+            self._lamp[self._find_port(name)] = 1.0
         except KeyError:
             pass
     def draw(self, active_paths: List[Tuple[str,str,str]], tphase: float):
-        # draw cables
-        for c in self.cables:
-            a = self.ports[c.a]; b = self.ports[c.b]
-            base = (180,180,180) if c.kind=="data" else (170,150,120)
-            pygame.draw.line(screen, base, a.pos, b.pos, 5)
-        # draw ports with lamps
-        for p in self.ports:
-            glow = max(0.0, min(1.0, p.lamp))
-            col = (18+int(200*glow),18+int(120*glow),18) if p.ptype=="data" else (18+int(180*glow),18+int(160*glow),12)
-            pygame.draw.circle(screen, col, p.pos, 7)
-            pygame.draw.circle(screen, (200,200,200), p.pos, 7, 1)
-            p.lamp *= 0.90  # decay
+        # draw cables, one bucket per kind
+        if self._segments_dirty:
+            self._rebuild_segments()
+        for kind, base in (("data",(180,180,180)), ("ctrl",(170,150,120))):
+            for a_pos, b_pos in self._segments[kind]:
+                pygame.draw.line(screen, base, a_pos, b_pos, 5)
+        # draw port lamps (the static outer rings live in the baked background);
+        # quantize glow to the sprite palette and push one batched blit call
+        levels = (np.clip(self._lamp, 0.0, 1.0) * 7.99).astype(np.uint8)
+        blits = []
+        for i, p in enumerate(self.ports):
+            palette = LAMP_SPRITES_CTRL if self._ctrl[i] else LAMP_SPRITES_DATA
+            blits.append((palette[levels[i]], (p.pos[0]-6, p.pos[1]-6)))
+        screen.blits(blits)
+        self._lamp *= 0.90  # decay, one C-level multiply
         # animate pulses
         for (a_name,b_name,kind) in active_paths:
             try:
@@ -189,11 +258,9 @@ class Plugboard:
             a = self.ports[ai]; b = self.ports[bi]
             x = int(a.pos[0] + (b.pos[0]-a.pos[0])*tphase)
             y = int(a.pos[1] + (b.pos[1]-a.pos[1])*tphase)
-            color = ACCENT if kind=="data" else CTRL
-            pygame.draw.circle(screen, (255,255,255), (x,y), 6)
-            pygame.draw.circle(screen, color, (x,y), 9, 2)
+            screen.blit(PULSE_SPRITES[kind], (x-10, y-10))
             # light lamps at endpoints
-            a.lamp = b.lamp = 1.0
+            self._lamp[ai] = self._lamp[bi] = 1.0
 
 # --------- Timing ---------
 WAVES = ["CPP","10P","9P","8P","7P","6P","5P","4P","3P","2P","1P","CCG","RP"]
@@ -205,20 +272,30 @@ class Timing:
         self.speed = 0.30       # seconds per pulse
         self.ccg_on = False
         self.rp_on = False
+        # rail rows and ring lamp centres are fixed for the widget's
+        # lifetime — no per-frame trig or label rendering
+        h = self.rect.height - 50
+        row_h = h/len(WAVES)
+        self._start_x = self.rect.x + 80
+        self._end_x = self.rect.right - 110
+        self._rails = [(int(self.rect.y + 36 + i*row_h), FONT_SM.render(name, True, TEXT).convert_alpha())
+                       for i,name in enumerate(WAVES)]
+        cx, cy, r = self.rect.right-60, self.rect.y+60, 28
+        self._ring_pts = []
+        for i in range(10):
+            ang = -math.pi/2 + 2*math.pi*i/10
+            self._ring_pts.append((int(cx + r*math.cos(ang)), int(cy + r*math.sin(ang))))
     def draw(self, stage_name:str):
         pygame.draw.rect(screen, PANEL, self.rect, border_radius=8)
         pygame.draw.rect(screen, (30,30,30), self.rect, 1, border_radius=8)
         t = FONT_BIG.render(f"Timing — stage: {stage_name}", True, TEXT)
         screen.blit(t, (self.rect.x+10, self.rect.y+8))
-        h = self.rect.height - 50
-        row_h = h/len(WAVES)
-        start_x = self.rect.x + 80
-        end_x = self.rect.right - 110
+        start_x = self._start_x
+        end_x = self._end_x
         # rails
-        for i,name in enumerate(WAVES):
-            y = int(self.rect.y + 36 + i*row_h)
+        for y, lab in self._rails:
             pygame.draw.line(screen, (120,120,120), (start_x,y), (end_x,y), 1)
-            lab = FONT_SM.render(name, True, TEXT); screen.blit(lab, (self.rect.x+10, y-8))
+            screen.blit(lab, (self.rect.x+10, y-8))
         # CC/RP indicators
         ind_ccg = FONT.render("CCG ON" if self.ccg_on else "CCG off", True, CTRL if self.ccg_on else DIMT)
         ind_rp  = FONT.render("RP  ON" if self.rp_on  else "RP  off", True, CTRL if self.rp_on else DIMT)
@@ -228,14 +305,28 @@ class Timing:
         x = int(start_x + (end_x-start_x)*(self.cursor/10))
         pygame.draw.line(screen, (255,120,120), (x, self.rect.y+30), (x, self.rect.bottom-10), 2)
         # ring
-        cx, cy, r = self.rect.right-60, self.rect.y+60, 28
-        for i in range(10):
-            ang = -math.pi/2 + 2*math.pi*i/10
-            px = int(cx + r*math.cos(ang)); py = int(cy + r*math.sin(ang))
+        for i,(px,py) in enumerate(self._ring_pts):
             on = (i==self.cursor)
             pygame.draw.circle(screen, (90,220,120) if on else (80,80,80), (px,py), 7)
             pygame.draw.circle(screen, (35,35,35), (px,py), 7, 1)
 
+def _mult_schedule(digits, a2, base):
+    """Partial-sum schedule for the repeated-add multiply.
+
+    Pure integer kernel, kept free of object state so it stays a
+    candidate for JIT compilation if the simulation ever grows hot.
+    One entry per visualized addition, LSD (index 9) -> MSD (0).
+    """
+    out = []
+    partial = base
+    step = a2
+    for digit_idx in range(9, -1, -1):
+        for _ in range(digits[digit_idx]):
+            partial += step
+            out.append(partial)
+        step *= 10
+    return out
+
 # --------- Multiplier Controller ---------
 class MultController:
     """
@@ -258,9 +349,16 @@ class MultController:
         self.shift = 0
         self.active = False
         self.done = False
+        self._schedule = []
+        self._step = 0
     def start(self):
         self.active = True
         self.done = False
+        # Precompute every partial sum up front: the accumulator state
+        # between add-times is display-only, so each visualized addition
+        # collapses to assigning the next precomputed value into A4.
+        self._schedule = _mult_schedule(self.a3.digits, self.a2.value(), self.a4.value())
+        self._step = 0
         self._setup_current_digit()
     def _setup_current_digit(self):
         if self.digit_idx < 0:
@@ -274,13 +372,53 @@ class MultController:
         """Called when timing cursor wraps (completed 10 pulses)."""
         if not self.active: return
         if self.remaining > 0:
-            self.a4.shift_add(self.a2.value(), self.shift)
+            self.a4.load(self._schedule[self._step])
+            self._step += 1
             self.remaining -= 1
         if self.remaining == 0:
             # move to next digit
             self.digit_idx -= 1
             self._setup_current_digit()
 
+def _build_paths_table():
+    """Enumerate every (stage, ccg_on, rp_on, late_window) combination once.
+
+    active_paths() used to rebuild the same small tuple lists every frame;
+    the whole state space is 5x2x2x2, so precompute it at import time.
+    """
+    table = {}
+    for stage in range(5):
+        for ccg in (False, True):
+            for rp in (False, True):
+                for late in (False, True):
+                    paths = []
+                    if ccg:
+                        if stage == 0:
+                            paths += [("CCG","A1.α","ctrl"),("CCG","A2.α","ctrl"),("CCG","A3.α","ctrl")]
+                        elif stage == 1:
+                            paths += [("CCG","MULT.IN1","ctrl"),("CCG","MULT.IN2","ctrl"),("CCG","A4.α","ctrl")]
+                        elif stage == 2:
+                            paths += [("CCG","A5.α","ctrl")]
+                        elif stage == 3:
+                            paths += [("CCG","PUNCH.IN","ctrl")]
+                    if rp and stage in (1,2):
+                        paths += [("RP","A4.α","ctrl"),("RP","A5.α","ctrl")]
+                    if stage == 0:
+                        paths += [("CT1.A","A1.α","data"),("CT2.A","A2.α","data"),("CT3.A","A3.α","data")]
+                    elif stage == 1:
+                        paths += [("A2.A","MULT.IN1","data"),("A3.A","MULT.IN2","data")]
+                        # output leg shows only in the last ~30% of the add-time
+                        if late:
+                            paths += [("MULT.OUT","A4.α","data")]
+                    elif stage == 2:
+                        paths += [("A1.A","A5.α","data"),("A4.A","A5.α","data")]
+                    elif stage == 3:
+                        paths += [("A5.A","PUNCH.IN","data")]
+                    table[(stage, ccg, rp, late)] = tuple(paths)
+    return table
+
+PATHS_TABLE = _build_paths_table()
+
 # --------- Demo Orchestrator ---------
 class Demo:
     def __init__(self):
@@ -302,6 +440,8 @@ class Demo:
         # Plugboard
         self.pb = Plugboard()
         self._build_ports_and_wiring()
+        self.pb_rect = pygame.Rect(20, 340, 1320, 380)
+        self._pb_bg = self._build_pb_bg()
 
         # Multiplier controller
         self.multctl = MultController(self.acc2, self.acc3, self.acc4)
@@ -311,11 +451,20 @@ class Demo:
         self.running = False
         self._acc = 0.0
         self.tphase = 0.0
+        self._dirty = True  # frame needs redrawing
 
         # CCG/RP gating visuals
         self.ccg_window = 0.0   # time remaining of gate ON for current stage (seconds)
         self.rp_pulse = 0.0     # time remaining of reset pulse ON (seconds)
 
+        # Four of the five UI hint lines never change; render them once.
+        self._static_tips = [FONT.render(s, True, TEXT).convert_alpha() for s in (
+            "ENTER = STEP (one digit pulse)",
+            "SPACE = RUN/PAUSE",
+            "R = Reset",
+            "Multiply uses repeated addition per digit. Each addition takes one add-time (10 pulses).",
+        )]
+
         self.reset()
 
     def _build_ports_and_wiring(self):
@@ -358,6 +507,22 @@ class Demo:
         self.pb.add_port("PUNCH.IN", (1180, 500), "data")
         self.pb.add_cable("A5.A", "PUNCH.IN")
 
+    def _build_pb_bg(self):
+        """Panel, grid lines and port outer rings never change — bake them once."""
+        bg = pygame.Surface(self.pb_rect.size)
+        bg.fill(BG)
+        local = bg.get_rect()
+        pygame.draw.rect(bg, PANEL, local, border_radius=8)
+        pygame.draw.rect(bg, (30,30,30), local, 1, border_radius=8)
+        t = FONT_BIG.render("Plugboard & Ports (expanded: A, S, AS, β, γ)", True, TEXT)
+        bg.blit(t, (10, 8))
+        for y in range(36, local.height-8, 26):
+            pygame.draw.line(bg, (120,120,124), (8,y), (local.width-8,y), 1)
+        ox, oy = self.pb_rect.topleft
+        for p in self.pb.ports:
+            pygame.draw.circle(bg, (200,200,200), (p.pos[0]-ox, p.pos[1]-oy), 7, 1)
+        return bg.convert()
+
     # ---- Stage helpers ----
     def stage_name(self):
         return ["LOAD","MULTIPLY","ADD","PUNCH","DONE"][self.stage]
@@ -371,14 +536,11 @@ class Demo:
         self.rp_pulse = seconds
 
     def handle_ccg_rp(self, dt):
-        if self.ccg_window > 0.0:
-            self.ccg_window -= dt
-            if self.ccg_window <= 0.0:
-                self.timing.ccg_on = False
-        if self.rp_pulse > 0.0:
-            self.rp_pulse -= dt
-            if self.rp_pulse <= 0.0:
-                self.timing.rp_on = False
+        # branchless: clamp the windows at zero and derive the flags
+        self.ccg_window = max(0.0, self.ccg_window - dt)
+        self.rp_pulse = max(0.0, self.rp_pulse - dt)
+        self.timing.ccg_on = self.ccg_window > 0.0
+        self.timing.rp_on = self.rp_pulse > 0.0
 
     # ---- Simulation tick ----
     def do_pulse(self):
@@ -418,44 +580,12 @@ class Demo:
 
         # advance timing cursor
         self.timing.cursor = (self.timing.cursor + 1) % 10
+        self._dirty = True
 
-    def active_paths(self)->List[Tuple[str,str,str]]:
-        """List of (src,dst,kind) for anim this pulse window."""
-        paths = []
-        idx = self.timing.cursor
-        # Control pulses (brief visualization)
-        if self.timing.ccg_on:
-            # Show CCG -> gate ports for the current stage
-            if self.stage == 0:
-                paths += [("CCG","A1.α","ctrl"),("CCG","A2.α","ctrl"),("CCG","A3.α","ctrl")]
-            elif self.stage == 1:
-                paths += [("CCG","MULT.IN1","ctrl"),("CCG","MULT.IN2","ctrl"),("CCG","A4.α","ctrl")]
-            elif self.stage == 2:
-                paths += [("CCG","A5.α","ctrl")]
-            elif self.stage == 3:
-                paths += [("CCG","PUNCH.IN","ctrl")]
-        if self.timing.rp_on:
-            # RP to affected units
-            affected = []
-            if self.stage in (1,2): affected = ["A4.α","A5.α"]
-            for port in affected:
-                paths.append(("RP", port, "ctrl"))
-
-        # Data flows
-        if self.stage == 0:
-            paths += [("CT1.A","A1.α","data"),("CT2.A","A2.α","data"),("CT3.A","A3.α","data")]
-        elif self.stage == 1:
-            # During multiply, show A2->MULT, A3->MULT, and MULT->A4 every add-time
-            paths += [("A2.A","MULT.IN1","data"),("A3.A","MULT.IN2","data")]
-            # Show MULT.OUT->A4.α when an addition occurs (near the end of add-time)
-            # Approx: if cursor in last 30% of window show output
-            if idx >= 7:
-                paths += [("MULT.OUT","A4.α","data")]
-        elif self.stage == 2:
-            paths += [("A1.A","A5.α","data"),("A4.A","A5.α","data")]
-        elif self.stage == 3:
-            paths += [("A5.A","PUNCH.IN","data")]
-        return paths
+    def active_paths(self)->Tuple[Tuple[str,str,str], ...]:
+        """Tuple of (src,dst,kind) for anim this pulse window."""
+        return PATHS_TABLE[(self.stage, self.timing.ccg_on, self.timing.rp_on,
+                            self.timing.cursor >= 7)]
 
     def reset(self):
         self.stage = 0
@@ -467,6 +597,7 @@ class Demo:
         self.multctl.reset()
         self.timing.ccg_on = False
         self.timing.rp_on = False
+        self._dirty = True
 
     def update(self, dt):
         # run mode
@@ -476,10 +607,13 @@ class Demo:
                 self._acc = 0.0
                 self.do_pulse()
         # animation along cables
-        self.tphase += dt / max(0.15, self.timing.speed)
-        if self.tphase > 1.0: self.tphase = 1.0
+        self.tphase = min(1.0, self.tphase + dt / max(0.15, self.timing.speed))
         # control windows
         self.handle_ccg_rp(dt)
+        # anything still animating keeps the frame dirty
+        if (self.running or self.tphase < 1.0 or self.ccg_window > 0.0
+                or self.rp_pulse > 0.0 or self.pb.lamps_lit()):
+            self._dirty = True
 
     # ---- draw ----
     def draw(self):
@@ -497,11 +631,8 @@ class Demo:
         self.acc5.draw(active_idx=self.timing.cursor if self.stage in (2,3) else None)
         self.punch.draw()
 
-        # Plugboard
-        pb_rect = pygame.Rect(20, 340, 1320, 380)
-        draw_panel(pb_rect, "Plugboard & Ports (expanded: A, S, AS, β, γ)")
-        for y in range(pb_rect.y+36, pb_rect.bottom-8, 26):
-            pygame.draw.line(screen, (120,120,124), (pb_rect.x+8,y), (pb_rect.right-8,y), 1)
+        # Plugboard (static panel/grid/rings baked in __init__)
+        screen.blit(self._pb_bg, self.pb_rect.topleft)
         self.pb.draw(self.active_paths(), self.tphase)
 
         # Multiplier progress label
@@ -512,41 +643,55 @@ class Demo:
         # Timing
         self.timing.draw(self.stage_name())
 
-        # UI hints
-        tips = [
-            "ENTER = STEP (one digit pulse)",
-            "SPACE = RUN/PAUSE",
-            "R = Reset",
-            f"Stage: {self.stage_name()} | Cursor: {self.timing.cursor} | RUN: {'ON' if self.running else 'OFF'}",
-            "Multiply uses repeated addition per digit. Each addition takes one add-time (10 pulses)."
-        ]
-        for i,s in enumerate(tips):
-            ts = FONT.render(s, True, TEXT)
-            screen.blit(ts, (20, 300 + i*18))
+        # UI hints (only the stage/cursor/RUN line is dynamic)
+        dyn = render_line(f"Stage: {self.stage_name()} | Cursor: {self.timing.cursor} | RUN: {'ON' if self.running else 'OFF'}")
+        st = self._static_tips
+        screen.blits([
+            (st[0], (20, 300)),
+            (st[1], (20, 318)),
+            (st[2], (20, 336)),
+            (dyn,   (20, 354)),
+            (st[3], (20, 372)),
+        ])
 
 # --------- main ---------
 def main():
     demo = Demo()
-    last = time.time()
+
+    def on_quit(e):
+        pygame.quit(); sys.exit()
+
+    def on_keydown(e):
+        if e.key == pygame.K_ESCAPE:
+            pygame.quit(); sys.exit()
+        elif e.key == pygame.K_RETURN:
+            demo.do_pulse()
+        elif e.key == pygame.K_SPACE:
+            demo.running = not demo.running
+            demo._acc = 0.0
+            demo._dirty = True
+        elif e.key == pygame.K_r:
+            demo.reset()
+
+    handlers = {pygame.QUIT: on_quit, pygame.KEYDOWN: on_keydown}
+
+    last = pygame.time.get_ticks()
     while True:
-        now = time.time(); dt = now - last; last = now
+        # SDL's cached ms counter — no syscall per frame like time.time()
+        now = pygame.time.get_ticks(); dt = (now - last) * 0.001; last = now
         for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_ESCAPE:
-                    pygame.quit(); sys.exit()
-                if e.key == pygame.K_RETURN:
-                    demo.do_pulse()
-                if e.key == pygame.K_SPACE:
-                    demo.running = not demo.running
-                    demo._acc = 0.0
-                if e.key == pygame.K_r:
-                    demo.reset()
+            handler = handlers.get(e.type)
+            if handler:
+                handler(e)
         demo.update(dt)
-        demo.draw()
-        pygame.display.flip()
-        clock.tick(60)
+        if demo._dirty:
+            demo.draw()
+            pygame.display.flip()
+            demo._dirty = False
+        if VSYNC:
+            clock.tick(0)            # flip already paces us to the refresh
+        else:
+            clock.tick_busy_loop(60) # tighter cadence than tick's coarse sleep
 
 if __name__ == "__main__":
     main()
@@ -102,6 +102,26 @@ connections = [
     ("Adder / Subtracter", "Card Punch")
 ]
 
+# 이름 -> 블록 dict (매 프레임 선형 탐색 제거)
+block_by_name = {b.name: b for b in blocks}
+# 블록은 움직이지 않으므로 배선 끝점도 한 번만 계산
+wire_segments = [(block_by_name[src].center(), block_by_name[dst].center())
+                 for src, dst in connections]
+
+# -----------------------
+# 정적 배경 (블록 + 배선은 런타임에 변하지 않으므로 한 장으로 미리 렌더링)
+# -----------------------
+def build_background(size):
+    bg = pygame.Surface(size)
+    bg.fill(BLACK)
+    for block in blocks:
+        block.draw(bg)
+    for start, end in wire_segments:
+        draw_orthogonal_wire(bg, start, end, LIGHT_GRAY, 2)
+    return bg.convert()
+
+background = build_background((WINDOW_WIDTH, WINDOW_HEIGHT))
+
 # -----------------------
 # 버튼
 # -----------------------
@@ -128,32 +148,34 @@ buttons = [
 # -----------------------
 # 메인 루프
 # -----------------------
+def on_quit(event):
+    global running
+    running = False
+
+def on_keydown(event):
+    global running, fullscreen, screen, background
+    if event.key == pygame.K_ESCAPE:
+        running = False
+    elif event.key == pygame.K_F11:
+        fullscreen = not fullscreen
+        if fullscreen:
+            screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # 해상도가 바뀌었으니 배경을 다시 굽는다
+        background = build_background(screen.get_size())
+
+HANDLERS = {pygame.QUIT: on_quit, pygame.KEYDOWN: on_keydown}
+
 running = True
 while running:
-    screen.fill(BLACK)
-
     for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                running = False
-            elif event.key == pygame.K_F11:
-                fullscreen = not fullscreen
-                if fullscreen:
-                    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-                else:
-                    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-
-    # 블록 그리기
-    for block in blocks:
-        block.draw(screen)
+        handler = HANDLERS.get(event.type)
+        if handler:
+            handler(event)
 
-    # 배선 그리기
-    for src_name, dst_name in connections:
-        src = next(b for b in blocks if b.name == src_name)
-        dst = next(b for b in blocks if b.name == dst_name)
-        draw_orthogonal_wire(screen, src.center(), dst.center(), LIGHT_GRAY, 2)
+    # 정적 회로도(블록 + 배선) 한 번에 블릿
+    screen.blit(background, (0, 0))
 
     # 버튼 그리기
     for btn in buttons:
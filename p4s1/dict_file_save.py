@@ -1,35 +1,38 @@
 import json
+try:
+    import orjson            # C 확장 인코더 (있으면 사용)
+except ImportError:
+    orjson = None
+
 def json_readwrite():
     d = {str(i): i*10 for i in range(10)}
 
     print('dict d', d)
     print('str(d):', str(d))
-    print('json.dumps(d):', json.dumps(d))  # 큰따옴표로 변환!
 
-    # JSON 형식으로 파일에 저장
-    with open('dic_test.json', 'w') as f:
-        f.write(json.dumps(d))
+    # 인코딩: orjson은 bytes 반환, 표준 json은 공백 없는 separators로
+    if orjson is not None:
+        encoded = orjson.dumps(d)
+    else:
+        encoded = json.dumps(d, separators=(',', ':')).encode('utf-8')
+    print('json dumps:', encoded)  # 큰따옴표로 변환!
+
+    # JSON 형식으로 파일에 저장 (바이너리 모드: str→utf8 재인코딩 생략)
+    with open('dic_test.json', 'wb') as f:
+        f.write(encoded)
 
     # 읽기
-    with open('dic_test.json', 'r') as f:
+    with open('dic_test.json', 'rb') as f:
         file_content = f.read()
-        
+
     print('file content:', file_content)
 
     # JSON으로 파싱
-    read_d = json.loads(file_content)
+    if orjson is not None:
+        read_d = orjson.loads(file_content)
+    else:
+        read_d = json.loads(file_content)
     print('converted back:', read_d)
     print(type(read_d))
-    
-def json_handwrite():
-    d = { str(i) : i*10 for i in range(10)}
-
-    print('dict d',d)
-    print('str(d)', str(d))
-    f = open('dic_test.json','w')
-    f.write(str(d).replace("'",'"'))
-    f = open('dic_test.json','r')
-    read_d = f.read()
-    print('read',eval(read_d))
-    
-json_readwrite()
\ No newline at end of file
+
+json_readwrite()
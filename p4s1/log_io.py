@@ -0,0 +1,104 @@
+# 로그 읽기/파싱 공용 모듈
+# main.py / main_json.py / test_file.py 가 각자 들고 있던 동일한 함수들을
+# 한 곳으로 모음 (.pyc 하나만 캐시되고, 수정도 한 번이면 됨)
+import csv
+import json
+from operator import itemgetter
+from pathlib import Path
+
+
+def read_log_file(filename):
+    """
+    로그 파일을 읽어서 전체 내용을 반환합니다.
+
+    Args:
+        filename: 읽을 로그 파일명
+
+    Returns:
+        파일의 전체 내용 문자열
+
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않을 때
+        UnicodeDecodeError: 파일 디코딩 오류 시
+    """
+    try:
+        # 한 번에 읽는 단발성 IO는 open/read/close 세 단계 대신 read_text 한 호출로
+        content = Path(filename).read_text(encoding='utf-8')
+        print(f'파일을 성공적으로 읽었습니다: {filename}')
+        return content
+    except FileNotFoundError:
+        print(f'오류: 파일을 찾을 수 없습니다 - {filename}')
+        raise
+    except UnicodeDecodeError as e:
+        print(f'디코딩 오류: {e}')
+        raise
+    except Exception as e:
+        print(f'예상치 못한 오류 발생: {e}')
+        raise
+
+
+def read_log_json(filename):
+    try:
+        with open(filename, 'r', encoding='utf-8', buffering=1 << 17) as file:
+            log_data = json.load(file)
+    except FileNotFoundError:
+        print(f'오류: 파일을 찾을 수 없습니다 - {filename}')
+        raise
+    except json.JSONDecodeError as e:
+        print(f'JSON 파싱 오류: {e}')
+        raise
+    except Exception as e:
+        print(f'예상치 못한 오류 발생: {e}')
+        raise
+    return log_data
+
+
+def iter_log_entries(filename):
+    """
+    로그 파일을 한 줄씩 스트리밍 파싱하여 (timestamp, event, message)
+    tuple을 생성합니다. 전체 내용을 문자열로 복사하지 않습니다.
+
+    Args:
+        filename: 파싱할 로그 파일명
+
+    Yields:
+        (timestamp, event, message) tuple
+    """
+    with open(filename, 'r', newline='', encoding='utf-8', buffering=1 << 17) as file:
+        # C로 구현된 csv 토크나이저로 라인 분할 (Python split/strip 루프 제거)
+        reader = csv.reader(file, quoting=csv.QUOTE_NONE)
+        next(reader, None)  # 헤더 라인 건너뛰기
+        for parts in reader:
+            if len(parts) < 3:  # 빈 라인/불완전 라인 무시
+                continue
+            if len(parts) > 3:  # 메시지 안의 콤마는 다시 합침
+                parts[2:] = [','.join(parts[2:])]
+            yield (parts[0].strip(), parts[1].strip(), parts[2].strip())
+
+
+def parse_log_to_list(filename):
+    """
+    로그 파일을 파싱하여 리스트 객체로 변환합니다.
+
+    Args:
+        filename: 파싱할 로그 파일명
+
+    Returns:
+        파싱된 로그 데이터의 리스트 [(timestamp, event, message), ...]
+    """
+    return list(iter_log_entries(filename))
+
+
+def sort_by_time_desc(log_list):
+    """
+    로그 리스트를 시간 역순으로 정렬합니다.
+
+    Args:
+        log_list: 정렬할 로그 리스트
+
+    Returns:
+        시간 역순으로 정렬된 로그 리스트
+    """
+    # ISO 8601 형식이므로 문자열 정렬로도 정확한 시간순 정렬 가능
+    sorted_list = sorted(log_list, key=itemgetter(0), reverse=True)
+    return sorted_list
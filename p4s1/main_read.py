@@ -40,8 +40,9 @@ def parse_log_to_list(log_content):
         파싱된 로그 데이터의 리스트
     """
     log_list = []
+    append = log_list.append  # 루프 안 LOAD_ATTR 제거 (행마다 메서드 조회 1회 절약)
     lines = log_content.strip().split('\n')
-    
+
     # 헤더 라인 건너뛰기
     for line in lines[1:]:  # 첫 번째 라인(헤더) 제외
         if line.strip():  # 빈 라인 무시
@@ -52,7 +53,7 @@ def parse_log_to_list(log_content):
                     'event': parts[1].strip(),
                     'message': parts[2].strip()
                 }
-                log_list.append(log_entry)
+                append(log_entry)
     
     return log_list
 
@@ -103,22 +104,13 @@ def save_to_json_manual(data_dict, filename):
         filename: 저장할 파일명
     """
     try:
+        # 전체 페이로드를 문자열 하나로 만들어 write 한 번으로 기록
+        # (마지막 콤마 여부는 join이 알아서 처리)
+        payload = '{\n' + ',\n'.join(
+            f'  "{timestamp}": ["{event}", "{message}"]'
+            for timestamp, (event, message) in data_dict.items()) + '\n}\n'
         with open(filename, 'w', encoding='utf-8') as file:
-            file.write('{\n')
-            
-            items = list(data_dict.items())
-            for i, (timestamp, event_message) in enumerate(items):
-                event, message = event_message
-                
-                # JSON 형식으로 수동 작성
-                file.write('  "' + timestamp + '": ["' + event + '", "' + message + '"]')
-                
-                # 마지막 항목이 아니면 콤마 추가
-                if i < len(items) - 1:
-                    file.write(',')
-                file.write('\n')
-            
-            file.write('}\n')
+            file.write(payload)
         
         print('JSON 파일로 성공적으로 저장되었습니다: ' + filename)
     except Exception as e: